@@ -7,11 +7,12 @@ Supports pre-defined content plans and custom content generation from JSON files
 
 from pathlib import Path
 from typing import List, Dict
-import json
+import orjson
 from datetime import datetime
 from loguru import logger
 
 from content_engine import ContentGenerator, ContentRequest
+from storage import write_json_atomic
 
 # Constants
 ESTIMATED_MINUTES_PER_PIECE = 2
@@ -108,8 +109,7 @@ class BatchContentGenerator:
             'errors': failed
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_json_atomic(output_path, report)
         
         logger.success(f"Report saved: {output_path}")
         return output_path
@@ -264,8 +264,7 @@ def main():
         plan = MONTH_ONE_CONTENT_PLAN
     elif args.plan == 'custom' and args.custom_file:
         logger.info(f"Loading custom plan from {args.custom_file}")
-        with open(args.custom_file, 'r') as f:
-            plan = json.load(f)
+        plan = orjson.loads(Path(args.custom_file).read_bytes())
     else:
         logger.error("Please specify a valid plan or provide --custom-file")
         return
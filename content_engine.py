@@ -9,15 +9,19 @@ import anthropic
 from typing import Dict, List, Optional, Literal, Union
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 import json
 from pathlib import Path
 from loguru import logger
 
 from settings import config
+from storage import write_json_atomic
 
 # Constants
 DEFAULT_PRODUCT_WORD_COUNT = 300
 DEFAULT_SOCIAL_WORD_COUNT = 150
+SOCIAL_POST_MAX_TOKENS = 1000
+PRODUCT_DESCRIPTION_MAX_TOKENS = 2000
 MAX_TITLE_LENGTH = 60
 MAX_META_DESCRIPTION_LENGTH = 155
 PLATFORM_CHAR_LIMITS = {
@@ -26,6 +30,65 @@ PLATFORM_CHAR_LIMITS = {
     'pinterest': {'description': 500, 'optimal': 200},
     'facebook': {'post': 63206, 'optimal': 40}
 }
+DEFAULT_SOCIAL_OPTIMAL_LENGTH = 150
+SOCIAL_PLATFORM_TIPS = {
+    'instagram': "- First line must grab attention (appears before 'more')",
+    'tiktok': "- Focus on quick, actionable tips",
+    'pinterest': "- SEO-optimized for Pinterest search",
+    'facebook': "- Encourage conversation and engagement"
+}
+
+
+def _build_social_prompt_template(platform: str) -> str:
+    """Build the social media prompt template for one platform.
+
+    Platform-specific text is filled in here; the returned template only
+    has ``{topic}``, ``{keywords}`` and ``{tone}`` placeholders left.
+
+    Args:
+        platform: Social media platform name
+
+    Returns:
+        Prompt template for ``str.format``
+    """
+    limit = PLATFORM_CHAR_LIMITS.get(platform, {'optimal': DEFAULT_SOCIAL_OPTIMAL_LENGTH})['optimal']
+    tips = '\n'.join(
+        tip if name == platform else ""
+        for name, tip in SOCIAL_PLATFORM_TIPS.items()
+    )
+
+    return f"""Create engaging social media content for {platform.title()} about: {{topic}}
+
+Platform: {platform}
+Optimal length: ~{limit} characters
+Keywords: {{keywords}}
+Brand voice: {{tone}}
+
+Content Requirements:
+- Hook reader in first line
+- Tell a story or share a tip
+- Include emotional connection
+- Natural call-to-action
+- Brand-appropriate hashtags
+
+For {platform}:
+{tips}
+
+Return JSON:
+{{{{
+    "caption": "Main post copy",
+    "hashtags": ["hashtag1", "hashtag2"],
+    "call_to_action": "Specific CTA",
+    "image_suggestion": "Description of ideal accompanying image",
+    "posting_tips": "Best practices for this specific post"
+}}}}"""
+
+
+# Built once at import so each prompt is a single format call
+SOCIAL_PROMPT_TEMPLATES = {
+    platform: _build_social_prompt_template(platform)
+    for platform in PLATFORM_CHAR_LIMITS
+}
 
 @dataclass
 class ContentRequest:
@@ -86,6 +149,18 @@ class GeneratedContent:
             'content_type': self.content_type
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> 'GeneratedContent':
+        """Create GeneratedContent from a dictionary produced by ``to_dict``.
+
+        Args:
+            data: Serialized content
+
+        Returns:
+            GeneratedContent instance
+        """
+        return cls(**{**data, 'created_at': datetime.fromisoformat(data['created_at'])})
+
 class ContentGenerator:
     """AI-powered content generation using Claude.
 
@@ -112,8 +187,9 @@ class ContentGenerator:
         self.brand_name: str = config.brand.name
         self.brand_tagline: str = config.brand.tagline
         
-    def _build_system_prompt(self) -> str:
-        """Build system prompt with brand guidelines"""
+    @cached_property
+    def _system_prompt(self) -> str:
+        """System prompt with brand guidelines, built once per generator"""
         return f"""You are an expert content writer for {self.brand_name}, a premium kitchen tools brand.
 
 Brand Guidelines:
@@ -241,36 +317,54 @@ Return JSON format:
         """
         platform = request.additional_context.get('platform', 'instagram') if request.additional_context else 'instagram'
 
-        limit = PLATFORM_CHAR_LIMITS.get(platform, {'optimal': 150})['optimal']
-        
-        return f"""Create engaging social media content for {platform.title()} about: {request.topic}
+        template = SOCIAL_PROMPT_TEMPLATES.get(platform) or _build_social_prompt_template(platform)
+        return template.format(
+            topic=request.topic,
+            keywords=', '.join(request.keywords),
+            tone=request.tone
+        )
 
-Platform: {platform}
-Optimal length: ~{limit} characters
-Keywords: {', '.join(request.keywords)}
-Brand voice: {request.tone}
+    def _build_social_media_batch_prompt(self, requests: List[ContentRequest]) -> str:
+        """Build a single prompt requesting several social media posts.
 
-Content Requirements:
-- Hook reader in first line
-- Tell a story or share a tip
-- Include emotional connection
-- Natural call-to-action
-- Brand-appropriate hashtags
+        Args:
+            requests: Content requests with platform information
 
-For {platform}:
-{"- First line must grab attention (appears before 'more')" if platform == 'instagram' else ""}
-{"- Focus on quick, actionable tips" if platform == 'tiktok' else ""}
-{"- SEO-optimized for Pinterest search" if platform == 'pinterest' else ""}
-{"- Encourage conversation and engagement" if platform == 'facebook' else ""}
+        Returns:
+            Formatted prompt for Claude AI
+        """
+        sections = '\n\n'.join(
+            f"--- Post {index} ---\n{self._build_social_media_prompt(request)}"
+            for index, request in enumerate(requests, 1)
+        )
 
-Return JSON:
-{{
-    "caption": "Main post copy",
-    "hashtags": ["hashtag1", "hashtag2"],
-    "call_to_action": "Specific CTA",
-    "image_suggestion": "Description of ideal accompanying image",
-    "posting_tips": "Best practices for this specific post"
-}}"""
+        return f"""Create {len(requests)} social media posts, one for each specification below.
+
+{sections}
+
+Return a JSON array with exactly {len(requests)} objects, in the same order as the
+specifications above, each using the JSON format described in its specification."""
+
+    def _build_product_description_batch_prompt(self, requests: List[ContentRequest]) -> str:
+        """Build a single prompt requesting several product descriptions.
+
+        Args:
+            requests: Product description requests
+
+        Returns:
+            Formatted prompt for Claude AI
+        """
+        sections = '\n\n'.join(
+            f"--- Product {index} ---\n{self._build_product_description_prompt(request)}"
+            for index, request in enumerate(requests, 1)
+        )
+
+        return f"""Write {len(requests)} product descriptions, one for each product below.
+
+{sections}
+
+Return a JSON array with exactly {len(requests)} objects, in the same order as the
+products above, each using the JSON format described in its specification."""
 
     def generate_blog_post(self, topic: str, keywords: List[str], 
                           word_count: Optional[int] = None) -> GeneratedContent:
@@ -294,7 +388,7 @@ Return JSON:
             message = self.client.messages.create(
                 model=self.model,
                 max_tokens=config.claude.max_tokens,
-                system=self._build_system_prompt(),
+                system=self._system_prompt,
                 messages=[{
                     "role": "user",
                     "content": self._build_blog_prompt(request)
@@ -353,8 +447,8 @@ Return JSON:
         try:
             message = self.client.messages.create(
                 model=self.model,
-                max_tokens=2000,
-                system=self._build_system_prompt(),
+                max_tokens=PRODUCT_DESCRIPTION_MAX_TOKENS,
+                system=self._system_prompt,
                 messages=[{
                     "role": "user",
                     "content": self._build_product_description_prompt(request)
@@ -362,9 +456,83 @@ Return JSON:
             )
             
             content_json = json.loads(message.content[0].text)
+            result = self._product_description_from_json(content_json, keywords, datetime.now())
             
-            # Combine descriptions
-            full_content = f"""# {content_json['headline']}
+            logger.success(f"Generated product description for '{product_name}'")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error generating product description: {e}")
+            raise
+
+    def generate_product_descriptions_batch(self, specs: List[Dict[str, any]]) -> List[GeneratedContent]:
+        """Generate several product descriptions with a single API request.
+
+        Args:
+            specs: Product specifications, each with product_name, keywords,
+                and optional product_details
+
+        Returns:
+            Generated descriptions in the same order as ``specs``
+
+        Raises:
+            ValueError: If the response does not contain one description per spec
+        """
+        requests = [
+            ContentRequest(
+                content_type='product_description',
+                topic=spec['product_name'],
+                keywords=spec['keywords'],
+                word_count=DEFAULT_PRODUCT_WORD_COUNT,
+                additional_context=spec.get('product_details') or {}
+            )
+            for spec in specs
+        ]
+
+        logger.info(f"Generating {len(requests)} product descriptions in one request")
+
+        try:
+            message = self.client.messages.create(
+                model=self.model,
+                max_tokens=PRODUCT_DESCRIPTION_MAX_TOKENS * len(requests),
+                system=self._system_prompt,
+                messages=[{
+                    "role": "user",
+                    "content": self._build_product_description_batch_prompt(requests)
+                }]
+            )
+
+            descriptions = json.loads(message.content[0].text)
+            if not isinstance(descriptions, list) or len(descriptions) != len(requests):
+                raise ValueError(f"Expected a JSON array of {len(requests)} product descriptions")
+
+            created_at = datetime.now()
+            results = [
+                self._product_description_from_json(content_json, request.keywords, created_at)
+                for content_json, request in zip(descriptions, requests)
+            ]
+
+            logger.success(f"Generated {len(results)} product descriptions")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error generating product descriptions batch: {e}")
+            raise
+
+    def _product_description_from_json(self, content_json: Dict[str, any], keywords: List[str],
+                                       created_at: datetime) -> GeneratedContent:
+        """Assemble a product description from the model's JSON response.
+
+        Args:
+            content_json: Parsed product description response
+            keywords: Keywords the description targets
+            created_at: Generation timestamp
+
+        Returns:
+            GeneratedContent object with product description
+        """
+        # Combine descriptions
+        full_content = f"""# {content_json['headline']}
 
 {content_json['short_description']}
 
@@ -373,23 +541,16 @@ Return JSON:
 ## Key Features & Benefits
 {chr(10).join(['- ' + item for item in content_json['features_and_benefits']])}
 """
-            
-            result = GeneratedContent(
-                title=content_json['headline'],
-                content=full_content,
-                meta_description=content_json['meta_description'],
-                keywords=keywords,
-                word_count=len(full_content.split()),
-                created_at=datetime.now(),
-                content_type='product_description'
-            )
-            
-            logger.success(f"Generated product description for '{product_name}'")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error generating product description: {e}")
-            raise
+
+        return GeneratedContent(
+            title=content_json['headline'],
+            content=full_content,
+            meta_description=content_json['meta_description'],
+            keywords=keywords,
+            word_count=len(full_content.split()),
+            created_at=created_at,
+            content_type='product_description'
+        )
 
     def generate_social_post(self, topic: str, keywords: List[str],
                             platform: str = 'instagram') -> Dict:
@@ -399,7 +560,7 @@ Return JSON:
             content_type='social_media',
             topic=topic,
             keywords=keywords,
-            word_count=150,
+            word_count=DEFAULT_SOCIAL_WORD_COUNT,
             additional_context={'platform': platform}
         )
         
@@ -408,8 +569,8 @@ Return JSON:
         try:
             message = self.client.messages.create(
                 model=self.model,
-                max_tokens=1000,
-                system=self._build_system_prompt(),
+                max_tokens=SOCIAL_POST_MAX_TOKENS,
+                system=self._system_prompt,
                 messages=[{
                     "role": "user",
                     "content": self._build_social_media_prompt(request)
@@ -427,6 +588,61 @@ Return JSON:
             logger.error(f"Error generating social post: {e}")
             raise
 
+    def generate_social_posts_batch(self, specs: List[Dict[str, any]]) -> List[Dict]:
+        """Generate several social media posts with a single API request.
+
+        Packing all posts into one prompt avoids a round-trip and a repeated
+        system prompt per post.
+
+        Args:
+            specs: Post specifications, each with topic, keywords, and platform
+
+        Returns:
+            Generated posts in the same order as ``specs``
+
+        Raises:
+            ValueError: If the response does not contain one post per spec
+        """
+        requests = [
+            ContentRequest(
+                content_type='social_media',
+                topic=spec['topic'],
+                keywords=spec['keywords'],
+                word_count=DEFAULT_SOCIAL_WORD_COUNT,
+                additional_context={'platform': spec.get('platform', 'instagram')}
+            )
+            for spec in specs
+        ]
+
+        logger.info(f"Generating {len(requests)} social posts in one request")
+
+        try:
+            message = self.client.messages.create(
+                model=self.model,
+                max_tokens=SOCIAL_POST_MAX_TOKENS * len(requests),
+                system=self._system_prompt,
+                messages=[{
+                    "role": "user",
+                    "content": self._build_social_media_batch_prompt(requests)
+                }]
+            )
+
+            posts = json.loads(message.content[0].text)
+            if not isinstance(posts, list) or len(posts) != len(requests):
+                raise ValueError(f"Expected a JSON array of {len(requests)} posts")
+
+            created_at = datetime.now().isoformat()
+            for post, request in zip(posts, requests):
+                post['platform'] = request.additional_context['platform']
+                post['created_at'] = created_at
+
+            logger.success(f"Generated {len(posts)} social posts")
+            return posts
+
+        except Exception as e:
+            logger.error(f"Error generating social posts batch: {e}")
+            raise
+
     def generate_content_batch(self, requests: List[ContentRequest]) -> List[GeneratedContent]:
         """Generate multiple pieces of content"""
         results = []
@@ -470,8 +686,7 @@ Return JSON:
         filename = f"{datetime.now().strftime('%Y%m%d')}_{slugify(content.title)}.json"
         filepath = output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(content.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json_atomic(filepath, content.to_dict())
             
         logger.info(f"Saved content to {filepath}")
         return filepath
@@ -0,0 +1,88 @@
+"""
+Term Lexicon Matching.
+
+Finds which terms of a fixed lexicon (product categories, query intent and
+relevance words) occur in a piece of text with a single precompiled regex
+pass, instead of one substring scan per term.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, Pattern, Set
+
+
+class TermMatcher:
+    """Precompiled matcher for a lexicon of substring terms.
+
+    ``find_re`` is a lookahead alternation, so matches don't consume text and
+    every start position is tried. A regex reports only one alternative per
+    position, though, so terms are tried longest first and each match is
+    expanded to the lexicon terms it starts with: "knife sets" also reports
+    "knife". Every term occurring in the text is therefore found.
+
+    Attributes:
+        terms: Lowercased lexicon terms
+        any_re: Pattern without groups that matches wherever any term occurs
+            (safe for ``Series.str.contains``)
+        find_re: Pattern whose ``findall`` yields the longest term at each
+            position where one occurs
+    """
+
+    __slots__ = ('terms', 'any_re', 'find_re', '_prefixes')
+
+    def __init__(self, terms: Iterable[str], ignore_case: bool = False) -> None:
+        """Compile the lexicon.
+
+        Args:
+            terms: Terms to match
+            ignore_case: Match regardless of case; otherwise the text is
+                expected to be lowercased already
+        """
+        self.terms: FrozenSet[str] = frozenset(term.lower() for term in terms if term)
+        alternation = '|'.join(map(re.escape, sorted(self.terms, key=len, reverse=True)))
+        flags = re.IGNORECASE if ignore_case else 0
+
+        # An empty lexicon must match nothing rather than everywhere
+        self.any_re: Pattern = re.compile(alternation if self.terms else r'(?!)', flags)
+        self.find_re: Pattern = re.compile(f'(?=({alternation}))' if self.terms else r'(?!)()', flags)
+        self._prefixes: Dict[str, FrozenSet[str]] = {
+            term: frozenset(other for other in self.terms if term.startswith(other))
+            for term in self.terms
+        }
+
+    def find(self, text: str) -> Set[str]:
+        """Find every lexicon term in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched lowercased terms
+        """
+        return self.expand(self.find_re.findall(text))
+
+    def expand(self, matches: Iterable[str]) -> Set[str]:
+        """Turn ``find_re`` matches into the set of terms they contain.
+
+        Only the matched substrings are lowercased, never the whole text.
+
+        Args:
+            matches: Substrings captured by ``find_re``
+
+        Returns:
+            Set of matched lowercased terms
+        """
+        found: Set[str] = set()
+        for match in matches:
+            found |= self._prefixes.get(match.lower(), frozenset())
+        return found
+
+    def count(self, matches: Iterable[str]) -> int:
+        """Count the distinct lexicon terms in ``find_re`` matches.
+
+        Args:
+            matches: Substrings captured by ``find_re``
+
+        Returns:
+            Number of distinct matched terms
+        """
+        return len(self.expand(matches))
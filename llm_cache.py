@@ -0,0 +1,84 @@
+"""
+LLM Response Cache.
+
+Persistent exact-match cache for LLM responses, stored in a local SQLite
+database. Keys are SHA-256 digests of the normalized request inputs, so
+repeated requests (for example product variants sharing a title) are served
+from disk instead of making another paid API call.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+# Constants
+DEFAULT_LLM_CACHE_PATH = Path('./cache/llm_cache.sqlite3')
+
+
+class LLMCache:
+    """Thread-safe key/value cache for JSON-serializable LLM responses.
+
+    Attributes:
+        path: SQLite database file path
+    """
+
+    def __init__(self, path: Path = DEFAULT_LLM_CACHE_PATH) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(**inputs: Any) -> str:
+        """Build a cache key from request inputs.
+
+        Args:
+            **inputs: JSON-serializable inputs that determine the response
+
+        Returns:
+            Hex SHA-256 digest of the canonicalized inputs
+        """
+        payload = orjson.dumps(inputs, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from ``make_key``
+            value: JSON-serializable response
+        """
+        data = orjson.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, data)
+            )
+            self._conn.commit()
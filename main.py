@@ -10,27 +10,72 @@ Coordinates all marketing automation tasks for Linoroso, including:
 This module provides both scheduled automation and manual task execution modes.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, List, Dict, NamedTuple, Optional, Sequence, Tuple
+import atexit
+import csv
+import hashlib
+import os
+import pickle
+import shutil
+import sys
+import threading
+import time
 import schedule
-import time as time_module
 from loguru import logger
-import json
+import orjson
 
-from settings import config
-from content_engine import ContentGenerator
-from seo_engine import SEOAutomation
-from optimizer import ProductOptimizer
+from settings import check_config, config
+from storage import append_jsonl, file_lock, write_bytes_atomic, write_json_atomic
+
+# Engines pull in anthropic, pandas and requests, so they are imported on first use
+if TYPE_CHECKING:
+    from content_engine import ContentGenerator
+    from seo_engine import SEOAutomation
+    from optimizer import ProductOptimizer, OptimizationResult
 
 # Constants
 DEFAULT_CONTENT_SCHEDULE_TIME = "02:00"
 DEFAULT_SEO_AUDIT_DAY = "monday"
 DEFAULT_SEO_AUDIT_TIME = "09:00"
 DEFAULT_PRODUCT_OPT_TIME = "03:00"
-SLEEP_INTERVAL_SECONDS = 60
+IDLE_SLEEP_SECONDS = 3600  # Sleep interval when no jobs are scheduled
 MAX_LOG_ENTRIES = 1000
+LOG_COMPACT_BYTES = 5 * 1024 * 1024  # Compact execution log past this size
+MAX_GENERATION_WORKERS = 8
 CTR_THRESHOLD = 2.0  # Alert threshold for CTR percentage
+ALERT_DEDUPE_SECONDS = 86400  # Suppress repeats of the same alert for 24h
+LOGS_DIR = Path('./logs')
+REPORTS_DIR = Path('./reports')
+DATA_DIR = Path('./data')
+SOCIAL_POSTS_DIR = DATA_DIR / 'social_posts'
+SOCIAL_PLATFORMS = ('instagram', 'pinterest')
+ALL_TASKS = ('content', 'seo_audit', 'product_optimization')
+CACHE_DIR = Path('./cache')
+PRODUCT_HASHES_FILE = CACHE_DIR / 'product_hashes.json'
+PRODUCT_RESULTS_FILE = CACHE_DIR / 'product_results.json'
+CSV_CACHE_FILE = CACHE_DIR / 'csv_cache.pkl'
+ALERT_DEDUPE_FILE = CACHE_DIR / 'alert_dedupe.json'
+EXECUTION_ITEMS_FILE = LOGS_DIR / 'execution_items.csv'
+EXECUTION_ITEM_FIELDS = ('ts', 'task', 'item_type', 'title', 'filepath', 'word_count')
+DEFAULT_BLOG_WORD_COUNT = 1000
+
+
+class Topic(NamedTuple):
+    """Content calendar entry.
+
+    Attributes:
+        topic: Content topic or title
+        keywords: Target SEO keywords
+        word_count: Target word count for blog posts
+    """
+    topic: str
+    keywords: Tuple[str, ...]
+    word_count: int = DEFAULT_BLOG_WORD_COUNT
 
 class LinorosoAutomation:
     """Main automation coordinator for Linoroso marketing tasks.
@@ -46,22 +91,77 @@ class LinorosoAutomation:
         execution_log: List of task execution records
     """
 
+    _log_sink_id: Optional[int] = None
+
     def __init__(self) -> None:
-        """Initialize automation coordinator with all necessary engines."""
-        self.content_generator = ContentGenerator()
-        self.seo_engine = SEOAutomation()
-        self.product_optimizer = ProductOptimizer()
-        self.execution_log: List[Dict] = []
+        """Initialize automation coordinator.
+
+        Engines are created lazily on first use, so a manual run of a single
+        task only constructs the engine it needs.
+        """
+        self.execution_log: Deque[Dict] = deque(maxlen=MAX_LOG_ENTRIES)
+        self._task_locks: Dict[str, threading.BoundedSemaphore] = {}
+        self._log_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._cache_lock = threading.Lock()
+        self._csv_cache: Dict[Tuple[str, ...], Tuple[Tuple[Tuple[float, int], ...], Any]] = (
+            self._load_csv_cache()
+        )
+        self._alert_cache: Dict[str, float] = self._load_json_cache(ALERT_DEDUPE_FILE)
+
+        self._social_dirs: Dict[str, Path] = {
+            platform: SOCIAL_POSTS_DIR / platform for platform in SOCIAL_PLATFORMS
+        }
+
+        # Create output directories once instead of on every write
+        for directory in (LOGS_DIR, REPORTS_DIR, DATA_DIR, CACHE_DIR, *self._social_dirs.values()):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # Line-buffered so each alert is visible immediately without reopening the file
+        self._alert_file = open(LOGS_DIR / 'alerts.log', 'a', buffering=1, encoding='utf-8')
+        atexit.register(self._alert_file.close)
+
+        self._configure_file_logging()
+        
+    @classmethod
+    def _configure_file_logging(cls) -> None:
+        """Register the rotating file log sink once per process.
+
+        Repeated instantiation must not add duplicate sinks, which would write
+        every log line multiple times. The sink is enqueued so disk writes
+        happen on loguru's background thread.
+        """
+        if cls._log_sink_id is not None:
+            return
 
         # Configure logging with rotation and retention
-        logger.add(
+        cls._log_sink_id = logger.add(
             "logs/automation_{time}.log",
             rotation="1 day",
             retention="30 days",
             level="INFO",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}"
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
+            enqueue=True
         )
-        
+
+    @cached_property
+    def content_generator(self) -> 'ContentGenerator':
+        """Content generation engine, created on first access."""
+        from content_engine import ContentGenerator
+        return ContentGenerator()
+
+    @cached_property
+    def seo_engine(self) -> 'SEOAutomation':
+        """SEO analysis engine, created on first access."""
+        from seo_engine import SEOAutomation
+        return SEOAutomation()
+
+    @cached_property
+    def product_optimizer(self) -> 'ProductOptimizer':
+        """Product listing optimizer, created on first access."""
+        from optimizer import ProductOptimizer
+        return ProductOptimizer()
+
     def run_daily_content_generation(self) -> None:
         """Generate daily blog posts and social media content.
 
@@ -78,58 +178,25 @@ class LinorosoAutomation:
         logger.info("🚀 Starting daily content generation")
         
         try:
+            run_ts = datetime.now()
+
             # Load content calendar or generate topics
             topics = self._get_daily_topics()
-            
-            generated_content = []
-            
-            for topic_data in topics:
-                try:
-                    # Generate blog post
-                    blog_post = self.content_generator.generate_blog_post(
-                        topic=topic_data['topic'],
-                        keywords=topic_data['keywords'],
-                        word_count=topic_data.get('word_count', 1000)
-                    )
-                    
-                    # Save to file
-                    filepath = self.content_generator.save_content(blog_post)
-                    generated_content.append({
-                        'type': 'blog_post',
-                        'title': blog_post.title,
-                        'filepath': str(filepath),
-                        'word_count': blog_post.word_count
-                    })
-                    
-                    logger.success(f"Generated blog post: {blog_post.title}")
-                    
-                except Exception as e:
-                    logger.error(f"Error generating content for {topic_data['topic']}: {e}")
-                    continue
-            
-            # Generate social media posts
-            social_topics = self._get_social_topics()
-            
-            for social_topic in social_topics[:3]:  # 3 posts per day
-                try:
-                    for platform in ['instagram', 'pinterest']:
-                        post = self.content_generator.generate_social_post(
-                            topic=social_topic['topic'],
-                            keywords=social_topic['keywords'],
-                            platform=platform
-                        )
-                        
-                        # Save for scheduling
-                        self._save_social_post(post, platform)
-                        
-                        generated_content.append({
-                            'type': f'{platform}_post',
-                            'topic': social_topic['topic']
-                        })
-                        
-                except Exception as e:
-                    logger.error(f"Error generating social post: {e}")
-                    continue
+            social_topics = self._get_social_topics()[:3]  # 3 posts per day
+
+            # Each job is dominated by LLM API latency, so run them concurrently
+            max_workers = max(1, min(MAX_GENERATION_WORKERS, len(topics) + 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                blog_futures = [
+                    executor.submit(self._generate_blog_job, topic_data) for topic_data in topics
+                ]
+                social_future = executor.submit(self._generate_social_batch, social_topics, run_ts)
+
+                generated_content = [
+                    item for item in (future.result() for future in blog_futures)
+                    if item is not None
+                ]
+                generated_content.extend(social_future.result())
             
             # Log execution
             self._log_execution('daily_content_generation', {
@@ -143,6 +210,83 @@ class LinorosoAutomation:
             logger.error(f"Error in daily content generation: {e}")
             raise
     
+    def _generate_blog_job(self, topic_data: Topic) -> Optional[Dict[str, any]]:
+        """Generate and save one blog post.
+
+        Args:
+            topic_data: Content calendar topic
+
+        Returns:
+            Summary of the generated post, or None if generation failed
+        """
+        try:
+            blog_post = self.content_generator.generate_blog_post(
+                topic=topic_data.topic,
+                keywords=list(topic_data.keywords),
+                word_count=topic_data.word_count
+            )
+
+            # Save to file
+            filepath = self.content_generator.save_content(blog_post)
+
+            logger.success(f"Generated blog post: {blog_post.title}")
+            return {
+                'type': 'blog_post',
+                'title': blog_post.title,
+                'filepath': str(filepath),
+                'word_count': blog_post.word_count
+            }
+
+        except Exception as e:
+            logger.error(f"Error generating content for {topic_data.topic}: {e}")
+            return None
+
+    def _generate_social_batch(
+        self,
+        social_topics: List[Topic],
+        run_ts: datetime
+    ) -> List[Dict[str, any]]:
+        """Generate and save social media posts for every topic and platform.
+
+        All posts are requested from the content generator in a single batch.
+
+        Args:
+            social_topics: Content calendar topics for social posts
+            run_ts: Start time of the content generation run
+
+        Returns:
+            Summaries of the generated posts (empty if generation failed)
+        """
+        specs = [
+            {'topic': social_topic.topic, 'keywords': list(social_topic.keywords), 'platform': platform}
+            for social_topic in social_topics
+            for platform in SOCIAL_PLATFORMS
+        ]
+        if not specs:
+            return []
+
+        try:
+            posts = self.content_generator.generate_social_posts_batch(specs)
+        except Exception as e:
+            logger.error(f"Error generating social posts: {e}")
+            return []
+
+        generated = []
+        for index, (spec, post) in enumerate(zip(specs, posts)):
+            # Save for scheduling; one failed write shouldn't drop the rest
+            try:
+                self._save_social_post(post, spec['platform'], index, run_ts)
+            except Exception as e:
+                logger.error(f"Error saving {spec['platform']} post for {spec['topic']}: {e}")
+                continue
+
+            generated.append({
+                'type': f"{spec['platform']}_post",
+                'topic': spec['topic']
+            })
+
+        return generated
+
     def run_weekly_seo_audit(self) -> None:
         """Weekly SEO performance audit and optimization suggestions.
 
@@ -157,20 +301,20 @@ class LinorosoAutomation:
         
         try:
             # Analyze current performance
-            pages_csv = Path("/mnt/project/Pages.csv")
-            queries_csv = Path("/mnt/project/Queries.csv")
+            pages_csv = self._resolve_data_file(config.data_sources.pages_csv_path)
+            queries_csv = self._resolve_data_file(config.data_sources.queries_csv_path)
 
-            if pages_csv.exists() and queries_csv.exists():
-                analysis = self.seo_engine.analyze_current_performance(
-                    pages_csv, queries_csv
+            if pages_csv and queries_csv:
+                analysis = self._cached(
+                    [pages_csv, queries_csv],
+                    lambda: self.seo_engine.analyze_current_performance(pages_csv, queries_csv)
                 )
 
                 # Generate report
-                report_path = Path('./reports') / f"seo_audit_{datetime.now().strftime('%Y%m%d')}.json"
-                report_path.parent.mkdir(parents=True, exist_ok=True)
+                report_path = REPORTS_DIR / f"seo_audit_{datetime.now().strftime('%Y%m%d')}.json"
 
-                with open(report_path, 'w', encoding='utf-8') as f:
-                    json.dump(analysis, f, indent=2, ensure_ascii=False)
+                # Compact output: the full GSC analysis can be large
+                write_json_atomic(report_path, analysis, indent=False)
 
                 logger.success(f"SEO audit report saved: {report_path}")
 
@@ -202,30 +346,37 @@ class LinorosoAutomation:
         logger.info("💎 Starting monthly product optimization")
         
         try:
-            products_csv = Path("/mnt/project/products_export_1 2.csv")
+            products_csv = self._resolve_data_file(config.data_sources.products_csv_path)
             
-            if products_csv.exists():
-                # Optimize all products
-                results = self.product_optimizer.optimize_all_products(products_csv)
+            if products_csv:
+                # Optimize products whose listing data changed since last run
+                results = self._optimize_changed_products(products_csv)
                 
                 # Generate reports
                 report_path = self.product_optimizer.generate_optimization_report(results)
                 
                 # Create Shopify import CSV
-                import_path = Path('./data') / f"shopify_import_{datetime.now().strftime('%Y%m%d')}.csv"
-                import_path.parent.mkdir(parents=True, exist_ok=True)
+                import_path = DATA_DIR / f"shopify_import_{datetime.now().strftime('%Y%m%d')}.csv"
                 self.product_optimizer.create_shopify_import_csv(results, import_path)
                 
-                logger.success(f"Optimized {len(results)} products")
+                # Already optimized listings come back unchanged; don't count them as updates
+                updated = sum(result.changed for result in results)
+                skipped = len(results) - updated
+                
+                logger.success(f"Optimized {updated} products ({skipped} already optimized)")
                 
                 self._log_execution('monthly_product_optimization', {
-                    'products_optimized': len(results),
+                    'products_optimized': updated,
+                    'products_already_optimized': skipped,
                     'report_path': str(report_path),
                     'import_csv': str(import_path)
                 })
                 
                 # Send summary email
-                self._send_alert(f"✅ Monthly optimization complete: {len(results)} products updated")
+                self._send_alert(
+                    f"✅ Monthly optimization complete: {updated} products updated, "
+                    f"{skipped} already optimized"
+                )
                 
             else:
                 logger.warning("Products CSV not found - skipping optimization")
@@ -234,6 +385,162 @@ class LinorosoAutomation:
             logger.error(f"Error in monthly product optimization: {e}")
             raise
     
+    def _resolve_data_file(self, source: Path) -> Optional[Path]:
+        """Locate an input data file, mirroring it locally when configured.
+
+        When config.data_sources.local_cache_dir is set, the source is copied
+        there only if its mtime or size changed since the last copy, so a
+        network-mounted export is read remotely once per update.
+
+        Args:
+            source: Configured input file path
+
+        Returns:
+            Path to read from, or None if the source does not exist
+        """
+        try:
+            source_stat = source.stat()
+        except FileNotFoundError:
+            return None
+
+        cache_dir = config.data_sources.local_cache_dir
+        if cache_dir is None:
+            return source
+
+        local = cache_dir / source.name
+        try:
+            local_stat = local.stat()
+            fresh = (local_stat.st_mtime, local_stat.st_size) == (source_stat.st_mtime, source_stat.st_size)
+        except FileNotFoundError:
+            fresh = False
+
+        if not fresh:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = local.with_suffix(local.suffix + '.tmp')
+            shutil.copy2(source, tmp_path)
+            os.replace(tmp_path, local)
+            logger.info(f"Copied {source} to local cache {local}")
+
+        return local
+
+    def _optimize_changed_products(self, products_csv: Path) -> List['OptimizationResult']:
+        """Optimize only products whose export rows changed since the last run.
+
+        Each product row is content-hashed and compared against the hashes
+        stored by the previous run. Unchanged products reuse their previous
+        optimization result so the Shopify import CSV still covers the full
+        catalog.
+
+        Args:
+            products_csv: Path to Shopify products export CSV
+
+        Returns:
+            Optimization results for every product in the export
+        """
+        from optimizer import OptimizationResult
+
+        hashes = self._cached(
+            [products_csv],
+            lambda: self.product_optimizer.hash_products(products_csv)
+        )
+        previous_hashes = self._load_json_cache(PRODUCT_HASHES_FILE)
+        previous_results = {
+            handle: OptimizationResult.from_dict(data)
+            for handle, data in self._load_json_cache(PRODUCT_RESULTS_FILE).items()
+        }
+
+        changed = {
+            handle for handle, digest in hashes.items()
+            if previous_hashes.get(handle) != digest or handle not in previous_results
+        }
+        logger.info(f"{len(changed)} of {len(hashes)} products changed since last optimization")
+
+        merged = {
+            handle: result for handle, result in previous_results.items()
+            if handle in hashes and handle not in changed
+        }
+
+        # Merge results as they stream in rather than collecting them first
+        if changed:
+            for result in self.product_optimizer.iter_optimized_products(products_csv, handles=changed):
+                merged[result.product_handle] = result
+
+        # Only remember hashes for products with a result so failures are retried
+        write_json_atomic(PRODUCT_HASHES_FILE, {handle: hashes[handle] for handle in merged})
+        write_json_atomic(
+            PRODUCT_RESULTS_FILE,
+            {handle: result.to_dict() for handle, result in merged.items()}
+        )
+
+        return [merged[handle] for handle in hashes if handle in merged]
+
+    def _load_json_cache(self, path: Path) -> Dict[str, any]:
+        """Load a JSON cache file, returning an empty dict if missing or unreadable.
+
+        Args:
+            path: Cache file path
+
+        Returns:
+            Cached data
+        """
+        if not path.exists():
+            return {}
+
+        try:
+            return orjson.loads(path.read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache {path}: {e}")
+            return {}
+
+    def _cached(self, paths: Sequence[Path], loader: Callable[[], Any]) -> Any:
+        """Return the result of a CSV-derived computation, reusing it while inputs are unchanged.
+
+        Results are keyed by the absolute input paths and invalidated when any
+        file's mtime or size changes. The cache is persisted to CSV_CACHE_FILE
+        so repeated or retried runs across restarts skip the CSV parse.
+
+        Args:
+            paths: Input CSV files the computation depends on
+            loader: Callable that computes the result from the files
+
+        Returns:
+            Cached or freshly computed result
+        """
+        key = tuple(str(path.resolve()) for path in paths)
+        stamp = tuple((stat.st_mtime, stat.st_size) for stat in (path.stat() for path in paths))
+
+        with self._cache_lock:
+            cached = self._csv_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            logger.debug(f"CSV cache hit: {', '.join(key)}")
+            return cached[1]
+
+        logger.debug(f"CSV cache miss: {', '.join(key)}")
+        value = loader()
+
+        # Other processes (e.g. --task all workers) share the cache file, so
+        # merge in what they've written since it was loaded
+        with self._cache_lock, file_lock(CSV_CACHE_FILE):
+            self._csv_cache = {**self._load_csv_cache(), **self._csv_cache, key: (stamp, value)}
+            write_bytes_atomic(CSV_CACHE_FILE, pickle.dumps(self._csv_cache))
+
+        return value
+
+    def _load_csv_cache(self) -> Dict[Tuple[str, ...], Tuple[Tuple[Tuple[float, int], ...], Any]]:
+        """Load the persisted CSV cache, returning an empty cache if missing or unreadable.
+
+        Returns:
+            Mapping of input paths to (file stamps, cached result)
+        """
+        if not CSV_CACHE_FILE.exists():
+            return {}
+
+        try:
+            return pickle.loads(CSV_CACHE_FILE.read_bytes())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable CSV cache: {e}")
+            return {}
+
     def run_quarterly_strategy_review(self):
         """Quarterly comprehensive SEO strategy and keyword research"""
         
@@ -255,77 +562,88 @@ class LinorosoAutomation:
             logger.error(f"Error in quarterly review: {e}")
             raise
     
-    def _get_daily_topics(self) -> List[Dict[str, any]]:
+    def _get_daily_topics(self) -> List[Topic]:
         """Get topics for today's content generation.
 
         In production, this would read from a content calendar or database.
         Currently returns sample topics for demonstration.
 
         Returns:
-            List of topic dictionaries with topic, keywords, and word_count
+            List of topics with keywords and word_count
         """
         # TODO: Implement content calendar integration
         topics = [
-            {
-                'topic': '5 Time-Saving Knife Techniques Every Home Cook Should Know',
-                'keywords': ['knife techniques', 'cooking tips', 'kitchen skills', 'time-saving cooking'],
-                'word_count': 1200
-            },
-            {
-                'topic': 'How to Properly Maintain Your Kitchen Knives',
-                'keywords': ['knife maintenance', 'knife care', 'kitchen tools', 'knife sharpening'],
-                'word_count': 1000
-            }
+            Topic(
+                topic='5 Time-Saving Knife Techniques Every Home Cook Should Know',
+                keywords=('knife techniques', 'cooking tips', 'kitchen skills', 'time-saving cooking'),
+                word_count=1200
+            ),
+            Topic(
+                topic='How to Properly Maintain Your Kitchen Knives',
+                keywords=('knife maintenance', 'knife care', 'kitchen tools', 'knife sharpening'),
+                word_count=1000
+            )
         ]
         
         return topics[:1]  # 1 blog post per day
     
-    def _get_social_topics(self) -> List[Dict[str, any]]:
+    def _get_social_topics(self) -> List[Topic]:
         """Get topics for social media posts.
 
         Returns:
-            List of topic dictionaries for social media content
+            List of topics for social media content
         """
         
         topics = [
-            {
-                'topic': 'Quick tip: The proper way to hold a chef knife',
-                'keywords': ['knife skills', 'cooking tips', 'kitchen basics']
-            },
-            {
-                'topic': 'Transform your meal prep with these organization ideas',
-                'keywords': ['meal prep', 'kitchen organization', 'cooking efficiency']
-            },
-            {
-                'topic': 'The secret to perfectly diced vegetables',
-                'keywords': ['knife skills', 'vegetable prep', 'cooking techniques']
-            }
+            Topic(
+                topic='Quick tip: The proper way to hold a chef knife',
+                keywords=('knife skills', 'cooking tips', 'kitchen basics')
+            ),
+            Topic(
+                topic='Transform your meal prep with these organization ideas',
+                keywords=('meal prep', 'kitchen organization', 'cooking efficiency')
+            ),
+            Topic(
+                topic='The secret to perfectly diced vegetables',
+                keywords=('knife skills', 'vegetable prep', 'cooking techniques')
+            )
         ]
         
         return topics
     
-    def _save_social_post(self, post: Dict[str, any], platform: str) -> None:
+    def _save_social_post(
+        self,
+        post: Dict[str, any],
+        platform: str,
+        index: int = 0,
+        run_ts: Optional[datetime] = None
+    ) -> None:
         """Save social media post for scheduling.
 
         Args:
             post: Social media post data
             platform: Social media platform name
+            index: Position of the post in the current batch
+            run_ts: Start time of the generation run (defaults to now)
         """
         
-        output_dir = Path('./data/social_posts') / platform
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = self._social_dirs[platform]
+        run_ts = run_ts or datetime.now()
         
-        filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"{run_ts.strftime('%Y%m%d_%H%M%S')}_{platform}_{index:02d}.json"
         filepath = output_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(post, f, indent=2)
+        write_json_atomic(filepath, post)
         
         logger.info(f"Saved {platform} post: {filepath}")
     
     def _log_execution(self, task_name: str, details: Dict[str, any]) -> None:
         """Log task execution to file and in-memory log.
 
+        Generated content items are also written one per row to
+        EXECUTION_ITEMS_FILE so reporting can load them with a single
+        pandas.read_csv instead of walking nested log entries.
+
         Args:
             task_name: Name of the executed task
             details: Task execution details and results
@@ -337,33 +655,90 @@ class LinorosoAutomation:
             'details': details
         }
         
-        self.execution_log.append(log_entry)
-        
-        # Save to file
-        log_file = Path('./logs/execution_log.json')
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing logs
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                all_logs = json.load(f)
-        else:
-            all_logs = []
-        
-        all_logs.append(log_entry)
+        log_file = LOGS_DIR / 'execution_log.jsonl'
 
-        # Keep last MAX_LOG_ENTRIES entries to prevent unbounded growth
-        all_logs = all_logs[-MAX_LOG_ENTRIES:]
-        
-        with open(log_file, 'w') as f:
-            json.dump(all_logs, f, indent=2)
+        # Scheduled tasks run on worker threads and --task all runs tasks in
+        # separate processes, so serialize log updates across both
+        with self._log_lock, file_lock(log_file):
+            self.execution_log.append(log_entry)
+            log_size = append_jsonl(log_file, log_entry)
+
+            if log_size > LOG_COMPACT_BYTES:
+                self._compact_execution_log(log_file)
+
+            if details.get('content'):
+                self._append_execution_items(log_entry['timestamp'], task_name, details['content'])
+
+    def _append_execution_items(self, timestamp: str, task_name: str, items: List[Dict[str, any]]) -> None:
+        """Append generated content items as flat rows to the items CSV.
+
+        Args:
+            timestamp: Execution timestamp in ISO format
+            task_name: Name of the executed task
+            items: Generated content summaries
+        """
+        write_header = not EXECUTION_ITEMS_FILE.exists()
+
+        with open(EXECUTION_ITEMS_FILE, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=EXECUTION_ITEM_FIELDS)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(
+                {
+                    'ts': timestamp,
+                    'task': task_name,
+                    'item_type': item.get('type', ''),
+                    'title': item.get('title') or item.get('topic', ''),
+                    'filepath': item.get('filepath', ''),
+                    'word_count': item.get('word_count', '')
+                }
+                for item in items
+            )
+
+    def _compact_execution_log(self, log_file: Path) -> None:
+        """Trim the execution log to the last MAX_LOG_ENTRIES entries.
+
+        Each line is a complete JSON object, so the tail is copied as raw
+        lines without parsing and atomically swapped into place.
+
+        Args:
+            log_file: Path to the JSONL execution log
+        """
+        with open(log_file, 'rb') as f:
+            tail = deque(f, maxlen=MAX_LOG_ENTRIES)
+
+        write_bytes_atomic(log_file, b''.join(tail))
+
+        logger.debug(f"Compacted execution log to {len(tail)} entries")
     
     def _send_alert(self, message: str) -> None:
         """Send alert via configured channels.
 
+        Identical messages are suppressed for ALERT_DEDUPE_SECONDS so a
+        persistent condition does not re-alert on every run. Send times are
+        persisted to ALERT_DEDUPE_FILE to survive restarts.
+
         Args:
             message: Alert message to send
         """
+        digest = hashlib.blake2b(message.encode(), digest_size=8).hexdigest()
+        now = time.time()
+
+        # Merge alerts sent by other processes since the cache was loaded
+        with self._log_lock, file_lock(ALERT_DEDUPE_FILE):
+            for key, sent_at in self._load_json_cache(ALERT_DEDUPE_FILE).items():
+                self._alert_cache[key] = max(sent_at, self._alert_cache.get(key, 0))
+
+            if self._alert_cache.get(digest, 0) + ALERT_DEDUPE_SECONDS > now:
+                logger.debug(f"Suppressing duplicate alert: {message}")
+                return
+
+            self._alert_cache = {
+                key: sent_at for key, sent_at in self._alert_cache.items()
+                if sent_at + ALERT_DEDUPE_SECONDS > now
+            }
+            self._alert_cache[digest] = now
+            write_json_atomic(ALERT_DEDUPE_FILE, self._alert_cache)
         
         logger.info(f"ALERT: {message}")
         
@@ -373,11 +748,8 @@ class LinorosoAutomation:
         # - SMS for critical alerts
         
         # For now, just log
-        alert_file = Path('./logs/alerts.log')
-        alert_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(alert_file, 'a') as f:
-            f.write(f"{datetime.now().isoformat()} - {message}\n")
+        with self._log_lock:
+            self._alert_file.write(f"{datetime.now().isoformat()} - {message}\n")
     
     def setup_schedule(self) -> None:
         """Set up automated task schedule.
@@ -390,19 +762,66 @@ class LinorosoAutomation:
         logger.info("⏰ Setting up automation schedule")
 
         # Daily content generation at 2 AM PST
-        schedule.every().day.at(DEFAULT_CONTENT_SCHEDULE_TIME).do(self.run_daily_content_generation)
+        schedule.every().day.at(DEFAULT_CONTENT_SCHEDULE_TIME).do(
+            self._run_in_background, self.run_daily_content_generation
+        )
 
         # Weekly SEO audit every Monday at 9 AM PST
-        schedule.every().monday.at(DEFAULT_SEO_AUDIT_TIME).do(self.run_weekly_seo_audit)
+        schedule.every().monday.at(DEFAULT_SEO_AUDIT_TIME).do(
+            self._run_in_background, self.run_weekly_seo_audit
+        )
 
         # Monthly product optimization on the 1st at 3 AM PST
-        schedule.every().month.at(DEFAULT_PRODUCT_OPT_TIME).do(self.run_monthly_product_optimization)
+        schedule.every().day.at(DEFAULT_PRODUCT_OPT_TIME).do(
+            self._run_on_month_start, self.run_monthly_product_optimization
+        )
         
         # Quarterly strategy review (manual trigger recommended)
         # schedule.every(90).days.do(self.run_quarterly_strategy_review)
         
         logger.success("✅ Automation schedule configured")
     
+    def _run_in_background(self, task: Callable[[], None]) -> None:
+        """Run a scheduled task on a worker thread.
+
+        Long-running jobs (e.g. monthly product optimization) no longer block
+        the scheduler loop. A per-task semaphore keeps at most one instance of
+        each task running; a run that fires while the previous one is still
+        in progress is skipped.
+
+        Args:
+            task: Task method to execute
+        """
+        task_name = task.__name__
+        lock = self._task_locks.setdefault(task_name, threading.BoundedSemaphore(1))
+
+        if not lock.acquire(blocking=False):
+            logger.warning(f"Skipping {task_name}: previous run still in progress")
+            return
+
+        def worker() -> None:
+            try:
+                task()
+            except Exception as e:
+                logger.error(f"Scheduled task {task_name} failed: {e}")
+            finally:
+                lock.release()
+
+        threading.Thread(target=worker, name=task_name, daemon=True).start()
+
+    def _run_on_month_start(self, task: Callable[[], None]) -> None:
+        """Run a task in the background only on the first day of the month.
+
+        The schedule library has no monthly interval, so monthly jobs are
+        registered daily and gated here (equivalent to a cron trigger with
+        day=1).
+
+        Args:
+            task: Task method to execute
+        """
+        if datetime.now().day == 1:
+            self._run_in_background(task)
+
     def run_scheduler(self) -> None:
         """Run the scheduler loop.
 
@@ -417,12 +836,21 @@ class LinorosoAutomation:
         logger.success("✅ Scheduler running - press Ctrl+C to stop")
 
         try:
-            while True:
+            while not self._stop_event.is_set():
+                # Sleep until the next job is due instead of polling
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    idle_seconds = IDLE_SLEEP_SECONDS
+                if idle_seconds > 0:
+                    self._stop_event.wait(timeout=idle_seconds)
                 schedule.run_pending()
-                time_module.sleep(SLEEP_INTERVAL_SECONDS)
         except KeyboardInterrupt:
             logger.info("⏹️  Scheduler stopped by user")
 
+    def stop_scheduler(self) -> None:
+        """Stop the scheduler loop, waking it if it is sleeping."""
+        self._stop_event.set()
+
     def run_manual_task(self, task_name: str) -> None:
         """Manually run a specific task.
 
@@ -445,12 +873,30 @@ class LinorosoAutomation:
             logger.info(f"Available tasks: {', '.join(tasks.keys())}")
 
 
+def _run_one(task_name: str) -> None:
+    """Run a single task in a fresh automation instance.
+
+    Module-level so it can be pickled for ProcessPoolExecutor workers.
+
+    Args:
+        task_name: Name of task to run
+    """
+    LinorosoAutomation().run_manual_task(task_name)
+
+
 def main() -> None:
     """Main entry point for the automation system.
 
     Parses command line arguments and either starts the scheduler
     or runs manual tasks based on user input.
     """
+    check_config()
+
+    # Fast path for the common no-argument scheduler start
+    if len(sys.argv) == 1:
+        LinorosoAutomation().run_scheduler()
+        return
+
     import argparse
     
     parser = argparse.ArgumentParser(description='Linoroso Shopify Marketing Automation')
@@ -468,20 +914,21 @@ def main() -> None:
     
     args = parser.parse_args()
     
-    automation = LinorosoAutomation()
-    
     if args.mode == 'scheduler':
         # Run continuous automation
-        automation.run_scheduler()
+        LinorosoAutomation().run_scheduler()
     else:
         # Manual execution
         if args.task == 'all':
             logger.info("Running all tasks...")
-            automation.run_daily_content_generation()
-            automation.run_weekly_seo_audit()
-            automation.run_monthly_product_optimization()
+            # Independent tasks, so run them in parallel on separate cores;
+            # the shared caches and logs are updated under file locks
+            with ProcessPoolExecutor(max_workers=len(ALL_TASKS)) as pool:
+                futures = [pool.submit(_run_one, task_name) for task_name in ALL_TASKS]
+                for future in futures:
+                    future.result()
         elif args.task:
-            automation.run_manual_task(args.task)
+            LinorosoAutomation().run_manual_task(args.task)
         else:
             logger.error("Please specify --task when using manual mode")
             parser.print_help()
@@ -6,16 +6,25 @@ Analyzes product data, generates optimized titles and descriptions, and
 provides SEO scoring and recommendations.
 """
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import csv
+import hashlib
+import re
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
-import json
 from datetime import datetime
 from loguru import logger
 
 from settings import config
-from content_engine import ContentGenerator
+from content_engine import ContentGenerator, GeneratedContent
+from lexicon import TermMatcher
+from llm_cache import LLMCache
+from storage import write_json_atomic
 
 # Constants
 MIN_TITLE_LENGTH = 30
@@ -28,6 +37,24 @@ MIN_IMAGE_COUNT = 3
 SEO_PERFECT_SCORE = 100.0
 POST_OPTIMIZATION_SCORE = 90.0
 MAX_TAGS = 15  # Shopify recommends 10-15 tags
+USE_CASE_TAGS = ('home cooking', 'meal prep', 'kitchen essentials')
+BENEFIT_TAGS = ('durable', 'premium quality')
+STATIC_TAGS = frozenset(USE_CASE_TAGS + BENEFIT_TAGS)  # Added to every product
+MAX_OPTIMIZATION_WORKERS = 8  # Concurrent LLM requests; keep within API rate limits
+PRODUCT_BATCH_SIZE = 4  # Product descriptions requested per LLM call
+OPTIMIZATION_WINDOW = MAX_OPTIMIZATION_WORKERS * 2  # Batches submitted ahead of the consumer
+PRODUCT_HASH_COLUMNS = [
+    'Title', 'Body (HTML)', 'Vendor', 'Type', 'Tags',
+    'Variant Price', 'Variant SKU', 'Image Src'
+]
+PRODUCT_CSV_COLUMNS = frozenset(['Handle', *PRODUCT_HASH_COLUMNS])  # Columns read from exports
+HTML_FORMATTING_RE = re.compile(r'<(?:p|div)\b', re.IGNORECASE)  # Paragraph/block markup
+REPORT_CSV_FIELDS = [
+    'Handle', 'Original Title', 'Optimized Title', 'Meta Description', 'Tags', 'SEO Score'
+]
+SHOPIFY_IMPORT_FIELDS = [
+    'Handle', 'Title', 'Body (HTML)', 'SEO Title', 'SEO Description', 'Tags', 'Published'
+]
 
 @dataclass
 class Product:
@@ -43,7 +70,15 @@ class Product:
         price: Product price
         sku: Stock keeping unit
         images: List of image URLs
+        title_lower: Lowercased title, computed once on creation
     """
+    # Declared by hand since dataclass(slots=True) needs Python 3.10;
+    # keep in sync with the fields below
+    __slots__ = (
+        'handle', 'title', 'description', 'vendor', 'product_type',
+        'tags', 'price', 'sku', 'images', 'title_lower'
+    )
+
     handle: str
     title: str
     description: str
@@ -54,12 +89,16 @@ class Product:
     sku: str
     images: List[str]
 
+    def __post_init__(self) -> None:
+        """Cache derived fields (slot-only, not dataclass fields)."""
+        self.title_lower: str = str(self.title).lower()
+
     @classmethod
-    def from_shopify_export(cls, row: pd.Series) -> 'Product':
+    def from_shopify_export(cls, row: Dict[str, any]) -> 'Product':
         """Create Product from Shopify CSV export row.
 
         Args:
-            row: Pandas Series from Shopify CSV
+            row: Record dict (or pandas Series) from Shopify CSV
 
         Returns:
             Product instance
@@ -79,6 +118,12 @@ class Product:
 @dataclass
 class OptimizationResult:
     """Result of product optimization"""
+    __slots__ = (
+        'product_handle', 'original_title', 'optimized_title', 'original_description',
+        'optimized_description', 'meta_description', 'suggested_tags', 'seo_score',
+        'improvement_notes', 'created_at'
+    )
+
     product_handle: str
     original_title: str
     optimized_title: str
@@ -90,6 +135,43 @@ class OptimizationResult:
     improvement_notes: List[str]
     created_at: datetime
 
+    def to_dict(self) -> Dict[str, any]:
+        """Convert to dictionary for JSON serialization.
+
+        Returns:
+            Dictionary representation of the result
+        """
+        return {
+            'product_handle': self.product_handle,
+            'original_title': self.original_title,
+            'optimized_title': self.optimized_title,
+            'original_description': self.original_description,
+            'optimized_description': self.optimized_description,
+            'meta_description': self.meta_description,
+            'suggested_tags': self.suggested_tags,
+            'seo_score': self.seo_score,
+            'improvement_notes': self.improvement_notes,
+            'created_at': self.created_at.isoformat()
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, any]) -> 'OptimizationResult':
+        """Create OptimizationResult from a dictionary produced by ``to_dict``.
+
+        Args:
+            data: Serialized optimization result
+
+        Returns:
+            OptimizationResult instance
+        """
+        return cls(**{**data, 'created_at': datetime.fromisoformat(data['created_at'])})
+
+    @property
+    def changed(self) -> bool:
+        """Whether the listing was rewritten (False for already optimized listings)."""
+        return (self.optimized_title != self.original_title
+                or self.optimized_description != self.original_description)
+
 class ProductOptimizer:
     """Optimize product listings using AI.
 
@@ -98,11 +180,22 @@ class ProductOptimizer:
 
     Attributes:
         content_generator: Content generation engine
+        llm_cache: Cache of generated product descriptions
     """
 
     def __init__(self) -> None:
         """Initialize product optimizer with content generator."""
         self.content_generator = ContentGenerator()
+        self.llm_cache = LLMCache()
+        self._brand_lower: str = config.brand.name.lower()
+
+        # One case-insensitive pass finds every category, including ones
+        # sharing a prefix ("Knife", "Knife Sets"), so titles and
+        # descriptions are never lowercased
+        self._category_by_lower: Dict[str, str] = {
+            cat.lower(): cat for cat in config.brand.main_categories
+        }
+        self._category_matcher = TermMatcher(self._category_by_lower, ignore_case=True)
         
     def analyze_product(self, product: Product) -> Dict[str, any]:
         """Analyze current product listing quality.
@@ -126,10 +219,7 @@ class ProductOptimizer:
             score -= 10
         
         # Check for keywords in title
-        keywords_in_title = any(
-            cat.lower() in product.title.lower() 
-            for cat in config.brand.main_categories
-        )
+        keywords_in_title = self._category_matcher.any_re.search(product.title) is not None
         if not keywords_in_title:
             issues.append("Title missing primary keyword")
             score -= 20
@@ -141,7 +231,7 @@ class ProductOptimizer:
             score -= 15
 
         # Check for HTML in description
-        if '<p>' in product.description or '<div>' in product.description:
+        if HTML_FORMATTING_RE.search(product.description):
             # Good - has formatting
             pass
         else:
@@ -172,34 +262,265 @@ class ProductOptimizer:
             'image_count': len(product.images)
         }
     
+    def analyze_products_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Score every product in a Shopify export with vectorized column operations.
+
+        Applies the same scoring rules as ``analyze_product`` to whole
+        columns at once, without building a Product or issue list per row.
+
+        Args:
+            df: Shopify export DataFrame with one row per product
+
+        Returns:
+            DataFrame with Handle, score, title_length, description_length,
+            tag_count, and image_count columns
+        """
+        def column(name: str) -> pd.Series:
+            return df[name] if name in df.columns else pd.Series(index=df.index, dtype=object)
+
+        titles = column('Title').fillna('').astype(str)
+        descriptions = column('Body (HTML)').fillna('').astype(str)
+        tags = column('Tags')
+        if 'Variant Price' in df.columns:
+            prices = pd.to_numeric(df['Variant Price'], errors='coerce')
+        else:
+            prices = pd.Series(0.0, index=df.index)
+
+        title_len = titles.str.len()
+        desc_len = descriptions.str.len()
+        tag_count = tags.str.count(',').add(1).where(tags.notna(), 0).astype(int)
+        image_count = column('Image Src').notna().astype(int)
+        keyword_mask = titles.str.contains(self._category_matcher.any_re)
+        html_mask = descriptions.str.contains(HTML_FORMATTING_RE)
+
+        score = (
+            SEO_PERFECT_SCORE
+            - 15 * (title_len < MIN_TITLE_LENGTH)
+            - 10 * (title_len > MAX_TITLE_LENGTH_WARNING)
+            - 20 * ~keyword_mask
+            - 15 * (desc_len < MIN_DESCRIPTION_LENGTH)
+            - 5 * ~html_mask
+            - 10 * (tag_count < MIN_TAG_COUNT)
+            - 20 * (prices <= 0)
+            - 10 * (image_count < MIN_IMAGE_COUNT)
+        ).clip(lower=0)
+
+        return pd.DataFrame({
+            'Handle': column('Handle'),
+            'score': score,
+            'title_length': title_len,
+            'description_length': desc_len,
+            'tag_count': tag_count,
+            'image_count': image_count
+        })
+    
     def optimize_product(self, product: Product, 
-                        target_keywords: Optional[List[str]] = None) -> OptimizationResult:
-        """Optimize a single product listing"""
+                        target_keywords: Optional[List[str]] = None,
+                        created_at: Optional[datetime] = None,
+                        force: bool = False) -> OptimizationResult:
+        """Optimize a single product listing.
+
+        Listings that already score at least POST_OPTIMIZATION_SCORE with an
+        optimal-length title are returned unchanged without calling the LLM.
+
+        Args:
+            product: Product to optimize
+            target_keywords: Keywords to target (extracted from the product if omitted)
+            created_at: Timestamp to record on the result (defaults to now)
+            force: Optimize even if the listing already scores well
+
+        Returns:
+            Optimization result
+        """
         
         logger.info(f"Optimizing product: {product.title}")
+        created_at = created_at or datetime.now()
         
         # Analyze current state
         analysis = self.analyze_product(product)
         
+        # Skip the LLM call for listings that are already in good shape
+        if not force and self._is_already_optimized(analysis):
+            return self._unchanged_result(product, analysis, created_at)
+        
         # Determine keywords
         if not target_keywords:
             target_keywords = self._extract_keywords(product)
         
         # Generate optimized content
-        product_details = {
+        key = self._description_cache_key(product, target_keywords)
+        cached = self.llm_cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM cache hit for '{product.title}'")
+            optimized_content = GeneratedContent.from_dict(cached)
+        else:
+            optimized_content = self.content_generator.generate_product_description(
+                product_name=product.title,
+                keywords=target_keywords,
+                product_details=self._product_details(product)
+            )
+            self.llm_cache.set(key, optimized_content.to_dict())
+        
+        return self._build_result(product, analysis, target_keywords, optimized_content, created_at)
+
+    def _optimize_batch(self, batch: List[Tuple[int, Product, Dict[str, any]]],
+                        created_at: datetime) -> List[OptimizationResult]:
+        """Optimize several products, generating uncached descriptions in one LLM request.
+
+        Listings flagged ``already_optimized`` by the batch analysis are
+        returned unchanged. If the batched request fails, each description
+        is requested on its own so one malformed response doesn't lose the
+        whole batch.
+
+        Args:
+            batch: Row index, Product, and ``analyze_products_batch`` row triples
+            created_at: Timestamp to record on the results
+
+        Returns:
+            Results for the successfully optimized products, in batch order
+        """
+        results: List[Optional[OptimizationResult]] = [None] * len(batch)
+        pending = []
+
+        for position, (idx, product, analysis) in enumerate(batch):
+            try:
+                if analysis['already_optimized']:
+                    results[position] = self._unchanged_result(product, analysis, created_at)
+                    continue
+
+                logger.info(f"Optimizing product: {product.title}")
+                keywords = self._extract_keywords(product)
+                key = self._description_cache_key(product, keywords)
+                cached = self.llm_cache.get(key)
+                if cached is not None:
+                    logger.debug(f"LLM cache hit for '{product.title}'")
+                    results[position] = self._build_result(
+                        product, analysis, keywords, GeneratedContent.from_dict(cached), created_at
+                    )
+                    continue
+
+                pending.append((position, idx, product, analysis, keywords, key))
+            except Exception as e:
+                logger.error(f"Error optimizing product at row {idx}: {e}")
+
+        if pending:
+            specs = [
+                {
+                    'product_name': product.title,
+                    'keywords': keywords,
+                    'product_details': self._product_details(product)
+                }
+                for _, _, product, _, keywords, _ in pending
+            ]
+            try:
+                contents = self.content_generator.generate_product_descriptions_batch(specs)
+            except Exception as e:
+                logger.warning(f"Batched description request failed, retrying individually: {e}")
+                contents = [None] * len(pending)
+
+            for (position, idx, product, analysis, keywords, key), spec, content in zip(
+                    pending, specs, contents):
+                try:
+                    if content is None:
+                        content = self.content_generator.generate_product_description(**spec)
+                    self.llm_cache.set(key, content.to_dict())
+                    results[position] = self._build_result(product, analysis, keywords, content, created_at)
+                except Exception as e:
+                    logger.error(f"Error optimizing product at row {idx}: {e}")
+
+        return [result for result in results if result is not None]
+
+    def _is_already_optimized(self, analysis: Dict[str, any]) -> bool:
+        """Check whether a listing already meets the post-optimization bar.
+
+        Args:
+            analysis: Result of ``analyze_product``
+
+        Returns:
+            True if the score and title length need no optimization
+        """
+        return (analysis['score'] >= POST_OPTIMIZATION_SCORE
+                and OPTIMAL_MIN_TITLE_LENGTH <= analysis['title_length'] <= OPTIMAL_MAX_TITLE_LENGTH)
+
+    def _unchanged_result(self, product: Product, analysis: Dict[str, any],
+                          created_at: datetime) -> OptimizationResult:
+        """Build the result for a listing that is left as is.
+
+        Args:
+            product: Already optimized product
+            analysis: Result of ``analyze_product``
+            created_at: Timestamp to record on the result
+
+        Returns:
+            Optimization result with the original title and description
+        """
+        logger.info(f"Skipping already optimized product: {product.title}")
+        return OptimizationResult(
+            product_handle=product.handle,
+            original_title=product.title,
+            optimized_title=product.title,
+            original_description=product.description,
+            optimized_description=product.description,
+            meta_description='',
+            suggested_tags=[tag.strip() for tag in product.tags if tag.strip()],
+            seo_score=analysis['score'],
+            improvement_notes=['Already optimized'],
+            created_at=created_at
+        )
+
+    def _product_details(self, product: Product) -> Dict[str, any]:
+        """Collect the current listing details passed to the description prompt.
+
+        Args:
+            product: Product being optimized
+
+        Returns:
+            Product details for the prompt
+        """
+        return {
             'current_title': product.title,
             'current_description': product.description,
             'product_type': product.product_type,
             'price': product.price,
             'existing_tags': product.tags
         }
-        
-        optimized_content = self.content_generator.generate_product_description(
-            product_name=product.title,
-            keywords=target_keywords,
-            product_details=product_details
+
+    def _description_cache_key(self, product: Product, keywords: List[str]) -> str:
+        """Build the LLM cache key for a product description.
+
+        The key covers everything sent in the prompt, so a product whose
+        description, price, or tags change gets a fresh response while
+        unchanged reruns are served from the cache.
+
+        Args:
+            product: Product being optimized
+            keywords: Target keywords
+
+        Returns:
+            Cache key
+        """
+        return LLMCache.make_key(
+            model=self.content_generator.model,
+            title=product.title_lower.strip(),
+            keywords=sorted(keywords),
+            product_type=product.product_type,
+            details=self._product_details(product)
         )
-        
+
+    def _build_result(self, product: Product, analysis: Dict[str, any], keywords: List[str],
+                      optimized_content: GeneratedContent, created_at: datetime) -> OptimizationResult:
+        """Assemble an optimization result from generated content.
+
+        Args:
+            product: Optimized product
+            analysis: Result of ``analyze_product`` before optimization
+            keywords: Target keywords
+            optimized_content: Generated product description
+            created_at: Timestamp to record on the result
+
+        Returns:
+            Optimization result
+        """
         # Extract components
         lines = optimized_content.content.split('\n')
         optimized_title = lines[0].replace('# ', '') if lines else product.title
@@ -208,7 +529,7 @@ class ProductOptimizer:
         meta_desc = optimized_content.meta_description
         
         # Suggest tags
-        suggested_tags = self._generate_tags(product, target_keywords)
+        suggested_tags = self._generate_tags(product, keywords)
         
         # Calculate improvement
         improvement_notes = []
@@ -216,7 +537,7 @@ class ProductOptimizer:
             improvement_notes.append(f"SEO score improved from {analysis['score']:.1f} to 90+")
         if len(optimized_title) > analysis['title_length']:
             improvement_notes.append("Title optimized for SEO length")
-        if target_keywords[0].lower() in optimized_title.lower():
+        if keywords[0].lower() in optimized_title.lower():
             improvement_notes.append("Primary keyword added to title")
         
         result = OptimizationResult(
@@ -229,12 +550,12 @@ class ProductOptimizer:
             suggested_tags=suggested_tags,
             seo_score=POST_OPTIMIZATION_SCORE,
             improvement_notes=improvement_notes,
-            created_at=datetime.now()
+            created_at=created_at
         )
         
         logger.success(f"Optimized product: {result.optimized_title}")
         return result
-    
+
     def _extract_keywords(self, product: Product) -> List[str]:
         """Extract relevant keywords from product"""
         keywords = []
@@ -244,111 +565,268 @@ class ProductOptimizer:
             keywords.append(product.product_type.lower())
         
         # Add matching categories
-        for category in config.brand.main_categories:
-            if category.lower() in product.title.lower() or \
-               category.lower() in product.description.lower():
-                keywords.append(category)
+        # Scanned separately so the description is never copied
+        matched = self._match_categories(product.title) | self._match_categories(product.description)
+        keywords.extend(
+            category for category_lower, category in self._category_by_lower.items()
+            if category_lower in matched
+        )
         
         # Add brand
-        keywords.append(config.brand.name.lower())
+        keywords.append(self._brand_lower)
         
         # Add from tags
         keywords.extend([tag.lower() for tag in product.tags[:3]])
         
         return keywords[:5]  # Top 5 keywords
     
+    def _match_categories(self, text: str) -> Set[str]:
+        """Find brand categories mentioned in text, ignoring case.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of matched lowercased category names
+        """
+        return self._category_matcher.find(text)
+
     def _generate_tags(self, product: Product, keywords: List[str]) -> List[str]:
         """Generate comprehensive tag set"""
-        tags = set()
-        
         # Add keywords as tags
-        tags.update(keywords)
+        tags = set(keywords)
         
         # Add product attributes
         tags.add(product.product_type.lower())
-        tags.add(config.brand.name.lower())
-        
-        # Add use case tags
-        use_cases = [
-            'home cooking',
-            'meal prep',
-            'kitchen essentials',
-            'gift idea',
-            'professional quality'
-        ]
-        tags.update(use_cases[:3])
-        
-        # Add benefit tags
-        benefits = [
-            'durable',
-            'premium quality',
-            'easy to use',
-            'dishwasher safe',
-            'ergonomic design'
-        ]
-        tags.update(benefits[:2])
+        tags.add(self._brand_lower)
+        
+        # Add use case and benefit tags
+        tags |= STATIC_TAGS
         
         return list(tags)[:MAX_TAGS]
     
-    def optimize_all_products(self, csv_path: Path) -> List[OptimizationResult]:
-        """Optimize all products from Shopify export CSV"""
+    def _load_products(self, csv_path: Path) -> pd.DataFrame:
+        """Read the unique products from a Shopify export.
+
+        Only the columns a Product is built from are parsed, and every
+        column is read as text to skip per-column type inference.
+
+        Args:
+            csv_path: Path to Shopify products export CSV
+
+        Returns:
+            DataFrame with one row per product handle
+        """
+        df = pd.read_csv(
+            csv_path,
+            usecols=lambda col: col in PRODUCT_CSV_COLUMNS,
+            dtype=str
+        )
+
+        # Get unique products (remove variant rows)
+        return df.drop_duplicates(subset=['Handle'])
+
+    def hash_products(self, csv_path: Path) -> Dict[str, str]:
+        """Compute a content hash for every product in a Shopify export.
+
+        Only the columns that feed into optimization are hashed, so a product
+        keeps the same hash until its listing data actually changes.
+
+        Args:
+            csv_path: Path to Shopify products export CSV
+
+        Returns:
+            Mapping of product handle to hex digest
+        """
+        products_df = self._load_products(csv_path)
+        columns = [col for col in PRODUCT_HASH_COLUMNS if col in products_df.columns]
+
+        hashes = {}
+        for handle, *values in products_df[['Handle'] + columns].itertuples(index=False):
+            if pd.isna(handle):
+                continue
+            payload = '\x1f'.join('' if pd.isna(v) else str(v) for v in values)
+            hashes[handle] = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+        return hashes
+
+    def optimize_all_products(self, csv_path: Path,
+                              handles: Optional[Set[str]] = None) -> List[OptimizationResult]:
+        """Optimize all products from Shopify export CSV.
+
+        Args:
+            csv_path: Path to Shopify products export CSV
+            handles: Optional set of product handles to restrict optimization to
+
+        Returns:
+            List of optimization results
+        """
+        return list(self.iter_optimized_products(csv_path, handles))
+
+    def iter_optimized_products(self, csv_path: Path,
+                                handles: Optional[Set[str]] = None) -> Iterator[OptimizationResult]:
+        """Optimize products from Shopify export CSV, yielding results in CSV order.
+
+        Products are optimized in batches of PRODUCT_BATCH_SIZE, each needing
+        at most one LLM request. Only OPTIMIZATION_WINDOW batches are submitted
+        ahead of the consumer, so a caller that writes results out as they
+        arrive holds a bounded number of results in memory regardless of
+        catalog size.
+
+        Args:
+            csv_path: Path to Shopify products export CSV
+            handles: Optional set of product handles to restrict optimization to
+
+        Yields:
+            Optimization result for each successfully optimized product
+        """
         
         logger.info(f"Loading products from {csv_path}")
         
         try:
-            df = pd.read_csv(csv_path)
-            
-            # Get unique products (remove variant rows)
-            products_df = df.drop_duplicates(subset=['Handle'])
-            
-            logger.info(f"Found {len(products_df)} unique products")
-            
-            results = []
+            products_df = self._load_products(csv_path)
+        except Exception as e:
+            logger.error(f"Error loading products: {e}")
+            raise
+
+        if handles is not None:
+            products_df = products_df[products_df['Handle'].isin(handles)]
+        
+        logger.info(f"Found {len(products_df)} unique products")
+        
+        # Score the whole export at once and decide up front which listings
+        # are already in good shape, so only the rest reach the LLM
+        analyses = self.analyze_products_batch(products_df)
+        analyses['already_optimized'] = (
+            (analyses['score'] >= POST_OPTIMIZATION_SCORE)
+            & analyses['title_length'].between(OPTIMAL_MIN_TITLE_LENGTH, OPTIMAL_MAX_TITLE_LENGTH)
+        )
+        logger.info(f"{int(analyses['already_optimized'].sum())} products already optimized")
+        
+        optimized = 0
+        batch_started = datetime.now()
+        
+        # Each optimization is dominated by LLM latency; the pool size caps
+        # concurrent requests to stay within API rate limits
+        with ThreadPoolExecutor(max_workers=MAX_OPTIMIZATION_WORKERS) as executor:
+            batches = self._iter_batches(self._iter_products(products_df, analyses))
+            submitted = (
+                (batch, executor.submit(self._optimize_batch, batch, batch_started))
+                for batch in batches
+            )
+            pending = deque(islice(submitted, OPTIMIZATION_WINDOW))
             
-            for idx, row in products_df.iterrows():
+            # Collect in submission order so results follow the CSV order,
+            # topping up the window as each batch is taken
+            while pending:
+                batch, future = pending.popleft()
+                pending.extend(islice(submitted, 1))
+                
                 try:
-                    product = Product.from_shopify_export(row)
-                    
-                    # Skip if missing critical data
-                    if not product.title or not product.handle:
-                        logger.warning(f"Skipping product with missing data at row {idx}")
-                        continue
-                    
-                    # Optimize
-                    result = self.optimize_product(product)
-                    results.append(result)
-                    
-                    # Rate limiting
-                    if len(results) % 10 == 0:
-                        logger.info(f"Optimized {len(results)} products...")
-                    
+                    results = future.result()
                 except Exception as e:
-                    logger.error(f"Error optimizing product at row {idx}: {e}")
+                    logger.error(f"Error optimizing products at rows {batch[0][0]}-{batch[-1][0]}: {e}")
                     continue
-            
-            logger.success(f"Optimized {len(results)} products")
-            return results
-            
-        except Exception as e:
-            logger.error(f"Error loading products: {e}")
-            raise
+                
+                for result in results:
+                    optimized += 1
+                    if optimized % 10 == 0:
+                        logger.info(f"Optimized {optimized} products...")
+                    
+                    yield result
+        
+        logger.success(f"Optimized {optimized} products")
+
+    def _iter_products(self, products_df: pd.DataFrame,
+                       analyses: pd.DataFrame) -> Iterator[Tuple[int, Product, Dict[str, any]]]:
+        """Build Products from export rows, skipping rows that can't be optimized.
+
+        Args:
+            products_df: DataFrame with one row per product
+            analyses: Matching rows from ``analyze_products_batch`` with an
+                ``already_optimized`` column
+
+        Yields:
+            Row index, Product, and analysis for each usable row
+        """
+        # Plain dicts avoid building a pandas Series per row
+        rows = zip(products_df.to_dict('records'), analyses.to_dict('records'))
+        for idx, (row, analysis) in enumerate(rows):
+            try:
+                product = Product.from_shopify_export(row)
+            except Exception as e:
+                logger.error(f"Error loading product at row {idx}: {e}")
+                continue
+
+            # Skip if missing critical data
+            if not product.title or not product.handle:
+                logger.warning(f"Skipping product with missing data at row {idx}")
+                continue
+
+            yield idx, product, analysis
+
+    def _iter_batches(self, products: Iterable[Tuple[int, Product, Dict[str, any]]]
+                      ) -> Iterator[List[Tuple[int, Product, Dict[str, any]]]]:
+        """Group products into batches for ``_optimize_batch``, keeping CSV order.
+
+        A batch closes once it holds PRODUCT_BATCH_SIZE products that need
+        the LLM, so already optimized listings don't take up slots in a
+        batched request, or once it holds PRODUCT_BATCH_SIZE already
+        optimized listings.
+
+        Args:
+            products: Row index, Product, and analysis triples
+
+        Yields:
+            Batches of row index, Product, and analysis triples
+        """
+        batch = []
+        to_optimize = 0
+        for item in products:
+            batch.append(item)
+            if not item[2]['already_optimized']:
+                to_optimize += 1
+            if to_optimize == PRODUCT_BATCH_SIZE or len(batch) - to_optimize == PRODUCT_BATCH_SIZE:
+                yield batch
+                batch = []
+                to_optimize = 0
+        if batch:
+            yield batch
     
     def generate_optimization_report(self, results: List[OptimizationResult],
                                     output_path: Optional[Path] = None) -> Path:
-        """Generate report of all optimizations"""
+        """Generate report of all optimizations
+
+        Listings left unchanged because they were already optimized are
+        counted separately and left out of the summary and rows.
+        """
         
+        now = datetime.now()
         if output_path is None:
-            output_path = Path('./reports') / f"product_optimization_{datetime.now().strftime('%Y%m%d')}.json"
+            output_path = Path('./reports') / f"product_optimization_{now.strftime('%Y%m%d')}.json"
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        already_optimized = sum(not r.changed for r in results)
+        results = [r for r in results if r.changed]
+        
+        scores = np.fromiter((r.seo_score for r in results), dtype=np.float64, count=len(results))
+        title_changed = np.fromiter(
+            (r.original_title != r.optimized_title for r in results), dtype=bool, count=len(results)
+        )
+        description_changed = np.fromiter(
+            (r.original_description != r.optimized_description for r in results),
+            dtype=bool, count=len(results)
+        )
+        
         report = {
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now.isoformat(),
             'total_products_optimized': len(results),
+            'products_already_optimized': already_optimized,
             'summary': {
-                'avg_improvement': sum(r.seo_score for r in results) / len(results) if results else 0,
-                'products_with_title_changes': sum(1 for r in results if r.original_title != r.optimized_title),
-                'products_with_new_descriptions': len(results)
+                'avg_improvement': float(scores.mean()) if results else 0,
+                'products_with_title_changes': int(title_changed.sum()),
+                'products_with_new_descriptions': int(description_changed.sum())
             },
             'optimizations': [
                 {
@@ -364,48 +842,53 @@ class ProductOptimizer:
             ]
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_json_atomic(output_path, report)
         
         # Also generate CSV for easy import
         csv_path = output_path.with_suffix('.csv')
-        df = pd.DataFrame([
-            {
-                'Handle': r.product_handle,
-                'Original Title': r.original_title,
-                'Optimized Title': r.optimized_title,
-                'Meta Description': r.meta_description,
-                'Tags': ', '.join(r.suggested_tags),
-                'SEO Score': r.seo_score
-            }
-            for r in results
-        ])
-        df.to_csv(csv_path, index=False)
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(
+                {
+                    'Handle': r.product_handle,
+                    'Original Title': r.original_title,
+                    'Optimized Title': r.optimized_title,
+                    'Meta Description': r.meta_description,
+                    'Tags': ', '.join(r.suggested_tags),
+                    'SEO Score': r.seo_score
+                }
+                for r in results
+            )
         
         logger.success(f"Generated optimization report: {output_path}")
         logger.success(f"Generated CSV for import: {csv_path}")
         
         return output_path
     
-    def create_shopify_import_csv(self, results: List[OptimizationResult],
+    def create_shopify_import_csv(self, results: Iterable[OptimizationResult],
                                   output_path: Path) -> Path:
         """Create CSV formatted for Shopify import"""
         
-        import_data = []
-        
-        for result in results:
-            import_data.append({
-                'Handle': result.product_handle,
-                'Title': result.optimized_title,
-                'Body (HTML)': result.optimized_description,
-                'SEO Title': result.optimized_title,
-                'SEO Description': result.meta_description,
-                'Tags': ', '.join(result.suggested_tags),
-                'Published': 'TRUE'
-            })
-        
-        df = pd.DataFrame(import_data)
-        df.to_csv(output_path, index=False)
+        # Unchanged listings are left out so the import doesn't blank their SEO fields
+        changed = (result for result in results if result.changed)
+        
+        # Stream rows straight to disk instead of building a DataFrame
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=SHOPIFY_IMPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(
+                {
+                    'Handle': result.product_handle,
+                    'Title': result.optimized_title,
+                    'Body (HTML)': result.optimized_description,
+                    'SEO Title': result.optimized_title,
+                    'SEO Description': result.meta_description,
+                    'Tags': ', '.join(result.suggested_tags),
+                    'Published': 'TRUE'
+                }
+                for result in changed
+            )
         
         logger.success(f"Created Shopify import CSV: {output_path}")
         return output_path
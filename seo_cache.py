@@ -0,0 +1,97 @@
+"""
+SEO Response Cache.
+
+Redis-backed cache-aside store for slow-changing SEO API responses such as
+SerpAPI results. The cache fails open: if Redis is not installed or not
+reachable, lookups miss and writes are skipped, so callers always fall back
+to the live API.
+"""
+
+import threading
+from typing import Any, Optional
+
+import orjson
+from loguru import logger
+
+from settings import config
+
+# Constants
+DEFAULT_TTL_SECONDS = 86400  # 24 hours
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+_client = None
+_disabled = False
+_client_lock = threading.Lock()  # SerpAPI lookups call in from several executor threads
+
+
+def _get_client() -> Optional[Any]:
+    """Return the shared Redis client, connecting on first use.
+
+    Returns:
+        Redis client, or None if Redis is unavailable
+    """
+    global _client, _disabled
+
+    if _client is not None or _disabled:
+        return _client
+
+    # Only one thread connects; the rest wait and reuse its outcome
+    with _client_lock:
+        if _client is not None or _disabled:
+            return _client
+
+        try:
+            import redis
+
+            client = redis.Redis.from_url(
+                config.redis.connection_url,
+                socket_connect_timeout=CONNECT_TIMEOUT_SECONDS,
+                socket_timeout=CONNECT_TIMEOUT_SECONDS
+            )
+            client.ping()
+            _client = client
+        except Exception as e:
+            logger.warning(f"SEO cache disabled, Redis unavailable: {e}")
+            _disabled = True
+
+    return _client
+
+
+def get(key: str) -> Optional[Any]:
+    """Look up a cached value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached value, or None on a miss or if Redis is unavailable
+    """
+    client = _get_client()
+    if client is None:
+        return None
+
+    try:
+        data = client.get(key)
+    except Exception as e:
+        logger.warning(f"SEO cache read failed for {key}: {e}")
+        return None
+
+    return orjson.loads(data) if data is not None else None
+
+
+def set(key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """Store a value with an expiry.
+
+    Args:
+        key: Cache key
+        value: JSON-serializable value
+        ttl: Time to live in seconds
+    """
+    client = _get_client()
+    if client is None:
+        return
+
+    try:
+        client.setex(key, ttl, orjson.dumps(value))
+    except Exception as e:
+        logger.warning(f"SEO cache write failed for {key}: {e}")
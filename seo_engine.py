@@ -6,17 +6,31 @@ Goal: 10x organic traffic growth over 12 months through strategic content
 and SEO optimization.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import importlib.util
 import requests
-from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import json
 from pathlib import Path
 from loguru import logger
-import pandas as pd
+import numpy as np
 from collections import defaultdict
+from itertools import islice
 
 from settings import config
+from lexicon import TermMatcher
+import seo_cache
+from storage import write_json_atomic
+
+# pandas is imported inside the methods that use it to keep imports fast
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Constants
 DEFAULT_LOCATION = "United States"
@@ -25,10 +39,56 @@ MIN_CLUSTER_SIZE = 2
 MONTHLY_CONTENT_TARGET = 75
 TRAFFIC_CAPTURE_RATE = 0.15  # Estimated 15% of search volume
 HIGH_PRIORITY_VOLUME_THRESHOLD = 5000
+GSC_PAGES_COLUMNS = ['Top pages', 'Clicks', 'Impressions', 'CTR', 'Position']
+GSC_PAGES_DTYPES = {'Clicks': 'int32', 'Impressions': 'int32'}
+GSC_QUERIES_COLUMNS = ['Top queries', 'Clicks', 'Position']
+GSC_QUERIES_DTYPES = {'Clicks': 'int32'}
+# pyarrow's multithreaded CSV reader is optional; fall back to the C parser
+GSC_CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+LOW_CTR_MIN_IMPRESSIONS = 100
+LOW_CTR_THRESHOLD = 2.0  # Percent
+MAX_OPPORTUNITIES_PER_TYPE = 5
+MAX_SERP_CONCURRENCY = 16  # Concurrent SerpAPI requests
+SERP_TIMEOUT_SECONDS = 10
+SERP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Query classification lexicons
+TRANSACTIONAL_TERMS = ('buy', 'purchase', 'order', 'deal', 'discount', 'shop', 'price')
+COMMERCIAL_TERMS = ('best', 'review', 'compare', 'vs', 'top', 'alternative')
+KITCHEN_TERMS = (
+    'kitchen', 'cooking', 'chef', 'culinary', 'food prep',
+    'cutting', 'chopping', 'slicing', 'dicing', 'meal prep',
+    'storage', 'organize', 'utensil', 'tool'
+)
+QUALITY_TERMS = ('premium', 'professional', 'quality', 'durable', 'sharp')
+CATEGORY_RELEVANCE_WEIGHT = 0.3
+KITCHEN_RELEVANCE_WEIGHT = 0.1
+QUALITY_RELEVANCE_WEIGHT = 0.05
+
+# Keyword metric estimates (replace with SEO tool data in production)
+BASE_SEARCH_VOLUME = 1000
+INTENT_PRIORITY = ('transactional', 'commercial', 'navigational')
+CPC_BY_INTENT = {
+    'transactional': 2.50,
+    'commercial': 1.80,
+    'navigational': 1.20,
+    'informational': 0.50
+}
+
 
-@dataclass
+TRANSACTIONAL_MATCHER = TermMatcher(TRANSACTIONAL_TERMS)
+COMMERCIAL_MATCHER = TermMatcher(COMMERCIAL_TERMS)
+KITCHEN_MATCHER = TermMatcher(KITCHEN_TERMS)
+QUALITY_MATCHER = TermMatcher(QUALITY_TERMS)
+
+
+@dataclass(frozen=True)
 class Keyword:
     """Keyword data structure"""
+    # Declared by hand since dataclass(slots=True) needs Python 3.10;
+    # keep in sync with the fields below
+    __slots__ = ('term', 'search_volume', 'difficulty', 'cpc', 'intent', 'relevance_score')
+
     term: str
     search_volume: int
     difficulty: float  # 0-100
@@ -36,9 +96,14 @@ class Keyword:
     intent: str  # informational, commercial, transactional, navigational
     relevance_score: float  # 0-1, how relevant to Linoroso
     
-@dataclass
+@dataclass(frozen=True)
 class KeywordCluster:
     """Grouped keywords by topic"""
+    __slots__ = (
+        'topic', 'primary_keyword', 'secondary_keywords',
+        'total_volume', 'avg_difficulty', 'content_opportunities'
+    )
+
     topic: str
     primary_keyword: Keyword
     secondary_keywords: List[Keyword]
@@ -52,48 +117,82 @@ class SEOAutomation:
     def __init__(self):
         self.serpapi_key = config.serpapi_key
         self.base_url = "https://serpapi.com/search"
+
+        # Keep-alive connection pool sized for concurrent seed requests,
+        # with backoff on rate limiting and transient server errors
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_SERP_CONCURRENCY,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=SERP_RETRY_STATUSES)
+        ))
+
+        # Brand-specific lexicons; the fixed ones are compiled at import
+        categories = config.brand.main_categories
+        self._category_matcher = TermMatcher(categories)
+        self._navigational_matcher = TermMatcher(['linoroso', *categories])
         
     def research_keywords(self, seed_keywords: List[str], 
-                         location: str = "United States") -> List[Keyword]:
-        """Research keywords from seed terms"""
+                         location: str = DEFAULT_LOCATION) -> List[Keyword]:
+        """Research keywords from seed terms.
+
+        Synchronous wrapper around ``aresearch_keywords``.
+
+        Args:
+            seed_keywords: Seed search terms
+            location: Search location
+
+        Returns:
+            Unique keywords sorted by relevance-weighted volume
+        """
+        return asyncio.run(self.aresearch_keywords(seed_keywords, location))
+
+    async def aresearch_keywords(self, seed_keywords: List[str],
+                                 location: str = DEFAULT_LOCATION) -> List[Keyword]:
+        """Research keywords from seed terms, querying all seeds concurrently.
+
+        SerpAPI requests are I/O-bound, so they run in worker threads and
+        the whole research step takes about as long as the slowest seed.
+
+        Args:
+            seed_keywords: Seed search terms
+            location: Search location
+
+        Returns:
+            Unique keywords sorted by relevance-weighted volume
+        """
         
         logger.info(f"Starting keyword research for {len(seed_keywords)} seed terms")
-        all_keywords = []
-        
-        for seed in seed_keywords:
-            try:
-                # Get related keywords from SERP
-                params = {
-                    "engine": "google",
-                    "q": seed,
-                    "location": location,
-                    "google_domain": "google.com",
-                    "gl": "us",
-                    "hl": "en",
-                    "api_key": self.serpapi_key
-                }
-                
-                response = requests.get(self.base_url, params=params)
-                data = response.json()
-                
-                # Extract related searches
-                related = data.get("related_searches", [])
-                
-                for item in related:
-                    query = item.get("query", "")
-                    if query:
-                        # Estimate metrics (in production, use proper SEO tool API)
-                        keyword = self._create_keyword_from_query(query)
-                        all_keywords.append(keyword)
-                        
-                logger.info(f"Found {len(related)} related keywords for '{seed}'")
-                
-            except Exception as e:
-                logger.error(f"Error researching keyword '{seed}': {e}")
+        queries: Dict[str, None] = {}  # Insertion-ordered set of unique queries
+        
+        # A dedicated pool bounds concurrency at the pool size and leaves
+        # the loop's default executor free for other blocking work
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_SERP_CONCURRENCY, len(seed_keywords))),
+            thread_name_prefix='serpapi'
+        ) as executor:
+            responses = await asyncio.gather(
+                *(loop.run_in_executor(executor, self._fetch_serp, seed, location)
+                  for seed in seed_keywords),
+                return_exceptions=True
+            )
+        
+        for seed, data in zip(seed_keywords, responses):
+            if isinstance(data, Exception):
+                logger.error(f"Error researching keyword '{seed}': {data}")
                 continue
+
+            # Extract related searches
+            related = data.get("related_searches", [])
+            
+            queries.update(dict.fromkeys(item["query"] for item in related if item.get("query")))
+            logger.info(f"Found {len(related)} related keywords for '{seed}'")
+        
+        # Estimate metrics (in production, use proper SEO tool API)
+        unique_keywords = self._create_keywords(list(queries))
         
-        # Remove duplicates and sort by relevance and volume
-        unique_keywords = {kw.term: kw for kw in all_keywords}.values()
+        # Sort by relevance and volume
         sorted_keywords = sorted(
             unique_keywords, 
             key=lambda x: (x.relevance_score * x.search_volume), 
@@ -102,116 +201,123 @@ class SEOAutomation:
         
         logger.success(f"Researched {len(sorted_keywords)} unique keywords")
         return sorted_keywords
-    
-    def _create_keyword_from_query(self, query: str) -> Keyword:
-        """Create keyword object with estimated metrics"""
-        
-        # Determine intent based on query terms
-        intent = self._classify_intent(query)
-        
-        # Calculate relevance to Linoroso
-        relevance = self._calculate_relevance(query)
+
+    def _fetch_serp(self, seed: str, location: str) -> Dict:
+        """Fetch Google search results for a seed term from SerpAPI.
+
+        Args:
+            seed: Search query
+            location: Search location
+
+        Returns:
+            Parsed SerpAPI response
+        """
+        # Get related keywords from SERP
+        params = {
+            "engine": "google",
+            "q": seed,
+            "location": location,
+            "google_domain": "google.com",
+            "gl": "us",
+            "hl": "en"
+        }
         
-        # Estimate metrics (replace with actual API calls in production)
-        return Keyword(
-            term=query,
-            search_volume=self._estimate_volume(query),
-            difficulty=self._estimate_difficulty(query),
-            cpc=self._estimate_cpc(query),
-            intent=intent,
-            relevance_score=relevance
+        # Related searches change slowly, so serve repeats from the cache
+        params_hash = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+        cache_key = f"SEOAutomation:v1:serp:{params_hash}"
+        cached = seo_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"SERP cache hit for '{seed}'")
+            return cached
+        
+        response = self._session.get(
+            self.base_url,
+            params={**params, "api_key": self.serpapi_key},
+            timeout=SERP_TIMEOUT_SECONDS
         )
-    
-    def _classify_intent(self, query: str) -> str:
-        """Classify search intent"""
-        query_lower = query.lower()
+        data = response.json()
         
-        # Transactional indicators
-        if any(word in query_lower for word in ['buy', 'purchase', 'order', 'deal', 'discount', 'shop', 'price']):
-            return 'transactional'
+        if 'error' not in data:
+            seo_cache.set(cache_key, data)
+        return data
+    
+    def _create_keywords(self, queries: List[str]) -> List[Keyword]:
+        """Create keyword objects with estimated metrics.
+
+        Metrics are computed column-wise over the whole batch, so each query
+        is lowercased and split once rather than once per helper.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            One keyword per query, in input order
+        """
+        if not queries:
+            return []
         
-        # Commercial investigation indicators
-        elif any(word in query_lower for word in ['best', 'review', 'compare', 'vs', 'top', 'alternative']):
-            return 'commercial'
+        import pandas as pd
         
-        # Navigational indicators
-        elif 'linoroso' in query_lower or any(brand in query_lower for brand in config.brand.main_categories):
-            return 'navigational'
+        lower = pd.Series(queries, dtype=object).str.lower()
+        words = lower.str.split().str.len().to_numpy()
         
-        # Default to informational
-        else:
-            return 'informational'
-    
-    def _calculate_relevance(self, query: str) -> float:
-        """Calculate relevance score to Linoroso products"""
-        query_lower = query.lower()
-        score = 0.0
-        
-        # Check for product category matches
-        for category in config.brand.main_categories:
-            if category.lower() in query_lower:
-                score += 0.3
-        
-        # Check for related kitchen terms
-        kitchen_terms = [
-            'kitchen', 'cooking', 'chef', 'culinary', 'food prep',
-            'cutting', 'chopping', 'slicing', 'dicing', 'meal prep',
-            'storage', 'organize', 'utensil', 'tool'
+        # Determine intent based on query terms, first match wins
+        intent_masks = [
+            lower.str.contains(TRANSACTIONAL_MATCHER.any_re).to_numpy(),
+            lower.str.contains(COMMERCIAL_MATCHER.any_re).to_numpy(),
+            lower.str.contains(self._navigational_matcher.any_re).to_numpy()
         ]
+        intents = np.select(intent_masks, INTENT_PRIORITY, default='informational')
         
-        for term in kitchen_terms:
-            if term in query_lower:
-                score += 0.1
-        
-        # Check for quality indicators
-        quality_terms = ['premium', 'professional', 'quality', 'durable', 'sharp']
-        for term in quality_terms:
-            if term in query_lower:
-                score += 0.05
+        # Calculate relevance to Linoroso
+        relevance = (
+            CATEGORY_RELEVANCE_WEIGHT * self._count_terms(lower, self._category_matcher)
+            + KITCHEN_RELEVANCE_WEIGHT * self._count_terms(lower, KITCHEN_MATCHER)
+            + QUALITY_RELEVANCE_WEIGHT * self._count_terms(lower, QUALITY_MATCHER)
+        )
+        relevance = np.minimum(relevance, 1.0)
         
-        return min(score, 1.0)
-    
-    def _estimate_volume(self, query: str) -> int:
-        """Estimate search volume (simplified version)"""
-        # In production, use actual SEO tool API
-        # This is a simplified estimation
-        base_volume = 1000
-        
-        # Adjust by query length (shorter = more volume typically)
-        words = len(query.split())
-        if words <= 2:
-            multiplier = 3.0
-        elif words <= 4:
-            multiplier = 1.5
-        else:
-            multiplier = 0.8
-            
-        return int(base_volume * multiplier)
-    
-    def _estimate_difficulty(self, query: str) -> float:
-        """Estimate keyword difficulty"""
-        # Simplified estimation
-        words = len(query.split())
+        # Estimate metrics (replace with actual API calls in production)
+        # Shorter queries typically have more volume
+        volumes = (BASE_SEARCH_VOLUME * np.select(
+            [words <= 2, words <= 4], [3.0, 1.5], default=0.8
+        )).astype(int)
         
         # Long-tail keywords are generally easier
-        if words >= 4:
-            return 25.0 + (10 * (words - 4))
-        else:
-            return 60.0 - (10 * words)
-    
-    def _estimate_cpc(self, query: str) -> float:
-        """Estimate CPC"""
-        # Commercial intent = higher CPC
-        intent = self._classify_intent(query)
+        difficulties = np.where(words >= 4, 25.0 + 10 * (words - 4), 60.0 - 10 * words)
         
-        cpc_map = {
-            'transactional': 2.50,
-            'commercial': 1.80,
-            'navigational': 1.20,
-            'informational': 0.50
-        }
+        # Commercial intent = higher CPC
+        cpcs = np.select(
+            intent_masks,
+            [CPC_BY_INTENT[intent] for intent in INTENT_PRIORITY],
+            default=CPC_BY_INTENT['informational']
+        )
         
-        return cpc_map.get(intent, 1.00)
+        return list(map(
+            Keyword,
+            queries,
+            volumes.tolist(),
+            difficulties.astype(float).tolist(),
+            cpcs.tolist(),
+            intents.tolist(),
+            relevance.tolist()
+        ))
+    
+    @staticmethod
+    def _count_terms(lower: 'pd.Series', matcher: TermMatcher) -> np.ndarray:
+        """Count the distinct lexicon terms found in each query.
+
+        One ``findall`` pass per lexicon over all queries; overlapping terms
+        such as "knife" and "knife sets" are both counted.
+
+        Args:
+            lower: Lowercased queries
+            matcher: Lexicon to count
+
+        Returns:
+            Number of distinct matched terms per query
+        """
+        return lower.str.findall(matcher.find_re).map(matcher.count).to_numpy()
     
     def cluster_keywords(
         self,
@@ -287,43 +393,40 @@ class SEOAutomation:
         return opportunities
     
     def generate_content_calendar(self, clusters: List[KeywordCluster], 
-                                  months: int = 12) -> pd.DataFrame:
+                                  months: int = 12) -> 'pd.DataFrame':
         """Generate 12-month content calendar from keyword clusters"""
+        import pandas as pd
         
         logger.info(f"Generating {months}-month content calendar")
 
         # Target: 50-100 pieces monthly = ~3 pieces per day
         target_pieces = months * MONTHLY_CONTENT_TARGET
         
-        calendar_data = []
-        piece_count = 0
-        
-        # Distribute content across clusters
-        for cluster in clusters:
-            # Create multiple pieces per cluster
-            for opportunity in cluster.content_opportunities[:3]:
-                if piece_count >= target_pieces:
-                    break
-                    
-                # Schedule across weeks
-                week_num = (piece_count // 3) + 1
-                
-                calendar_data.append({
-                    'week': week_num,
-                    'month': (week_num // 4) + 1,
-                    'topic_cluster': cluster.topic,
-                    'primary_keyword': cluster.primary_keyword.term,
-                    'search_volume': cluster.primary_keyword.search_volume,
-                    'difficulty': cluster.primary_keyword.difficulty,
-                    'content_type': opportunity,
-                    'target_intent': cluster.primary_keyword.intent,
-                    'priority': 'High' if cluster.total_volume > HIGH_PRIORITY_VOLUME_THRESHOLD else 'Medium',
-                    'estimated_traffic': int(cluster.total_volume * TRAFFIC_CAPTURE_RATE)
-                })
-                
-                piece_count += 1
-        
-        df = pd.DataFrame(calendar_data)
+        # Distribute content across clusters, up to 3 pieces per cluster
+        pieces = list(islice(
+            ((cluster, opportunity)
+             for cluster in clusters
+             for opportunity in cluster.content_opportunities[:3]),
+            target_pieces
+        ))
+        piece_clusters = [cluster for cluster, _ in pieces]
+        total_volumes = np.array([cluster.total_volume for cluster in piece_clusters], dtype=np.int64)
+        
+        # Schedule across weeks
+        weeks = np.arange(len(pieces)) // 3 + 1
+        
+        df = pd.DataFrame({
+            'week': weeks,
+            'month': weeks // 4 + 1,
+            'topic_cluster': [cluster.topic for cluster in piece_clusters],
+            'primary_keyword': [cluster.primary_keyword.term for cluster in piece_clusters],
+            'search_volume': [cluster.primary_keyword.search_volume for cluster in piece_clusters],
+            'difficulty': [cluster.primary_keyword.difficulty for cluster in piece_clusters],
+            'content_type': [opportunity for _, opportunity in pieces],
+            'target_intent': [cluster.primary_keyword.intent for cluster in piece_clusters],
+            'priority': np.where(total_volumes > HIGH_PRIORITY_VOLUME_THRESHOLD, 'High', 'Medium'),
+            'estimated_traffic': (total_volumes * TRAFFIC_CAPTURE_RATE).astype(np.int64)
+        })
         
         logger.success(f"Generated calendar with {len(df)} content pieces")
         return df
@@ -331,20 +434,28 @@ class SEOAutomation:
     def analyze_current_performance(self, pages_csv: Path, 
                                    queries_csv: Path) -> Dict:
         """Analyze current SEO performance from GSC data"""
+        import pandas as pd
         
         logger.info("Analyzing current SEO performance")
         
         try:
             # Load GSC data
-            pages_df = pd.read_csv(pages_csv)
-            queries_df = pd.read_csv(queries_csv)
+            pages_df = pd.read_csv(
+                pages_csv, usecols=GSC_PAGES_COLUMNS, dtype=GSC_PAGES_DTYPES, engine=GSC_CSV_ENGINE
+            )
+            queries_df = pd.read_csv(
+                queries_csv, usecols=GSC_QUERIES_COLUMNS, dtype=GSC_QUERIES_DTYPES, engine=GSC_CSV_ENGINE
+            )
+            
+            # Parse the "1.23%" strings once for both the mean and the filter
+            pages_df['CTR_value'] = pages_df['CTR'].str.rstrip('%').astype(float)
             
             # Calculate key metrics
             analysis = {
                 'total_pages': len(pages_df),
                 'total_clicks': pages_df['Clicks'].sum(),
                 'total_impressions': pages_df['Impressions'].sum(),
-                'avg_ctr': pages_df['CTR'].str.rstrip('%').astype(float).mean(),
+                'avg_ctr': pages_df['CTR_value'].mean(),
                 'avg_position': pages_df['Position'].mean(),
                 'total_queries': len(queries_df),
                 'top_pages': pages_df.nlargest(10, 'Clicks')[['Top pages', 'Clicks', 'CTR']].to_dict('records'),
@@ -354,34 +465,28 @@ class SEOAutomation:
             
             # Identify opportunities
             # 1. High impression, low CTR pages
-            low_ctr = pages_df[
-                (pages_df['Impressions'] > 100) & 
-                (pages_df['CTR'].str.rstrip('%').astype(float) < 2.0)
-            ]
+            low_ctr = pages_df.query(
+                'Impressions > @LOW_CTR_MIN_IMPRESSIONS and CTR_value < @LOW_CTR_THRESHOLD'
+            ).head(MAX_OPPORTUNITIES_PER_TYPE)
             
-            for _, row in low_ctr.head(5).iterrows():
-                analysis['opportunities'].append({
-                    'type': 'Improve CTR',
-                    'page': row['Top pages'],
-                    'current_ctr': row['CTR'],
-                    'impressions': row['Impressions'],
-                    'action': 'Optimize title and meta description'
-                })
+            analysis['opportunities'].extend(
+                low_ctr[['Top pages', 'CTR', 'Impressions']]
+                .rename(columns={'Top pages': 'page', 'CTR': 'current_ctr', 'Impressions': 'impressions'})
+                .assign(type='Improve CTR', action='Optimize title and meta description')
+                [['type', 'page', 'current_ctr', 'impressions', 'action']]
+                .to_dict('records')
+            )
             
             # 2. Keywords ranking 4-10 (easy wins)
-            quick_wins = queries_df[
-                (queries_df['Position'] >= 4) & 
-                (queries_df['Position'] <= 10)
-            ]
+            quick_wins = queries_df.query('4 <= Position <= 10').head(MAX_OPPORTUNITIES_PER_TYPE)
             
-            for _, row in quick_wins.head(5).iterrows():
-                analysis['opportunities'].append({
-                    'type': 'Quick Win - Move to Page 1',
-                    'query': row['Top queries'],
-                    'current_position': row['Position'],
-                    'clicks': row['Clicks'],
-                    'action': 'Add internal links and update content'
-                })
+            analysis['opportunities'].extend(
+                quick_wins[['Top queries', 'Position', 'Clicks']]
+                .rename(columns={'Top queries': 'query', 'Position': 'current_position', 'Clicks': 'clicks'})
+                .assign(type='Quick Win - Move to Page 1', action='Add internal links and update content')
+                [['type', 'query', 'current_position', 'clicks', 'action']]
+                .to_dict('records')
+            )
             
             logger.success("Completed SEO performance analysis")
             return analysis
@@ -390,8 +495,40 @@ class SEOAutomation:
             logger.error(f"Error analyzing performance: {e}")
             raise
     
-    def generate_seo_report(self, output_path: Optional[Path] = None) -> Path:
-        """Generate comprehensive SEO strategy report"""
+    def generate_seo_report(self, output_path: Optional[Path] = None,
+                            pages_csv: Optional[Path] = None,
+                            queries_csv: Optional[Path] = None) -> Path:
+        """Generate comprehensive SEO strategy report.
+
+        Synchronous wrapper around ``agenerate_seo_report``.
+
+        Args:
+            output_path: Report destination; defaults to a dated file in ./reports
+            pages_csv: Optional GSC pages export to include current performance
+            queries_csv: Optional GSC queries export to include current performance
+
+        Returns:
+            Path to the saved report
+        """
+        return asyncio.run(self.agenerate_seo_report(output_path, pages_csv, queries_csv))
+
+    async def agenerate_seo_report(self, output_path: Optional[Path] = None,
+                                   pages_csv: Optional[Path] = None,
+                                   queries_csv: Optional[Path] = None) -> Path:
+        """Generate comprehensive SEO strategy report.
+
+        Keyword research and the GSC performance analysis are independent,
+        so they run concurrently and the report takes as long as the slower
+        of the two.
+
+        Args:
+            output_path: Report destination; defaults to a dated file in ./reports
+            pages_csv: Optional GSC pages export to include current performance
+            queries_csv: Optional GSC queries export to include current performance
+
+        Returns:
+            Path to the saved report
+        """
         
         if output_path is None:
             output_path = Path('./reports') / f"seo_strategy_{datetime.now().strftime('%Y%m%d')}.json"
@@ -412,7 +549,21 @@ class SEOAutomation:
             "cooking essentials"
         ]
         
-        keywords = self.research_keywords(seed_keywords)
+        if pages_csv is not None and queries_csv is not None:
+            keywords, performance = await asyncio.gather(
+                self.aresearch_keywords(seed_keywords),
+                asyncio.to_thread(self.analyze_current_performance, pages_csv, queries_csv),
+                return_exceptions=True
+            )
+            if isinstance(keywords, BaseException):
+                raise keywords
+            if isinstance(performance, BaseException):
+                logger.warning(f"Report will omit current performance: {performance}")
+                performance = None
+        else:
+            keywords = await self.aresearch_keywords(seed_keywords)
+            performance = None
+        
         clusters = self.cluster_keywords(keywords)
         calendar = self.generate_content_calendar(clusters)
         
@@ -444,9 +595,11 @@ class SEOAutomation:
             'content_calendar_preview': calendar.head(20).to_dict('records')
         }
         
+        if performance is not None:
+            report['current_performance'] = performance
+        
         # Save report
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_json_atomic(output_path, report)
         
         # Also save calendar as CSV
         calendar_path = output_path.parent / f"content_calendar_{datetime.now().strftime('%Y%m%d')}.csv"
@@ -460,19 +613,26 @@ class SEOAutomation:
 
 # Example usage
 if __name__ == "__main__":
+    import orjson
+    
     seo = SEOAutomation()
     
+    # Include current performance if GSC data available
+    pages_csv = config.data_sources.pages_csv_path
+    queries_csv = config.data_sources.queries_csv_path
+    has_gsc_data = pages_csv.exists() and queries_csv.exists()
+    
     # Generate comprehensive strategy
-    report_path = seo.generate_seo_report()
+    report_path = seo.generate_seo_report(
+        pages_csv=pages_csv if has_gsc_data else None,
+        queries_csv=queries_csv if has_gsc_data else None
+    )
     print(f"\n✅ SEO strategy report generated: {report_path}")
     
-    # Analyze current performance if GSC data available
     try:
-        pages_csv = Path("/mnt/project/Pages.csv")
-        queries_csv = Path("/mnt/project/Queries.csv")
+        analysis = orjson.loads(report_path.read_bytes()).get('current_performance')
         
-        if pages_csv.exists() and queries_csv.exists():
-            analysis = seo.analyze_current_performance(pages_csv, queries_csv)
+        if analysis:
             print(f"\n📊 Current Performance:")
             print(f"Total Clicks: {analysis['total_clicks']:,}")
             print(f"Total Impressions: {analysis['total_impressions']:,}")
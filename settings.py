@@ -7,25 +7,98 @@ including API credentials, database settings, and business logic parameters.
 """
 
 import os
+import re
 import warnings
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, List, Dict, Tuple
 from dataclasses import dataclass, field
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Constants
 DEFAULT_CLAUDE_MODEL = "claude-sonnet-4-20250514"
 DEFAULT_MAX_TOKENS = 4000
 DEFAULT_SHOPIFY_API_VERSION = "2024-01"
 DEFAULT_MYSQL_PORT = 3306
+DEFAULT_REDIS_PORT = 6379
 DEFAULT_MIN_WORD_COUNT = 800
 DEFAULT_MAX_WORD_COUNT = 1500
 DEFAULT_SOCIAL_POSTS_PER_DAY = 3
+DEFAULT_PAGES_CSV_PATH = "/mnt/project/Pages.csv"
+DEFAULT_QUERIES_CSV_PATH = "/mnt/project/Queries.csv"
+DEFAULT_PRODUCTS_CSV_PATH = "/mnt/project/products_export_1 2.csv"
+ENV_FILE = Path(__file__).resolve().parent / '.env'
+LEGACY_ENV_CACHE_FILE = ENV_FILE.with_name('.env.cache.json')
+_CATEGORY_SPLIT_RE = re.compile(r'\s*,\s*')
+
+def _load_env() -> None:
+    """Load variables from .env without overriding the real environment.
+
+    .env is parsed once per process; the values derived from it are then
+    cached in memory by ``_parse_env`` and ``get_config``. Nothing parsed
+    from .env is written back to disk, so its secrets exist in one file only.
+    """
+    # Earlier versions cached the parsed .env, secrets included, in plaintext
+    try:
+        LEGACY_ENV_CACHE_FILE.unlink(missing_ok=True)
+    except OSError as e:
+        warnings.warn(f"Could not remove {LEGACY_ENV_CACHE_FILE.name}: {e}")
+
+    if not ENV_FILE.exists():
+        return
+
+    from dotenv import dotenv_values
+
+    for key, value in dotenv_values(ENV_FILE).items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+
+
+# Load environment variables from .env file
+_load_env()
+
+# Numeric environment settings: name -> (parser, default)
+_ENV_SPEC: Dict[str, Tuple[Callable[[str], Any], Any]] = {
+    'MAX_TOKENS': (int, DEFAULT_MAX_TOKENS),
+    'MYSQL_PORT': (int, DEFAULT_MYSQL_PORT),
+    'MIN_WORD_COUNT': (int, DEFAULT_MIN_WORD_COUNT),
+    'MAX_WORD_COUNT': (int, DEFAULT_MAX_WORD_COUNT),
+    'SOCIAL_POSTS_PER_DAY': (int, DEFAULT_SOCIAL_POSTS_PER_DAY),
+    'INFLUENCER_OUTREACH_LIMIT': (int, 50),
+    'MIN_FOLLOWER_COUNT': (int, 10000),
+    'MIN_ENGAGEMENT_RATE': (float, 3.0),
+    'COMMISSION_BASIC': (int, 10),
+    'COMMISSION_INTERMEDIATE': (int, 15),
+    'COMMISSION_ADVANCED': (int, 20),
+    'REDIS_PORT': (int, DEFAULT_REDIS_PORT),
+    'REDIS_DB': (int, 0),
+}
+
+
+@lru_cache(maxsize=None)
+def _parse_env() -> Mapping[str, Any]:
+    """Parse every numeric environment setting in one pass.
+
+    Invalid values fall back to their default with a warning.
+
+    Returns:
+        Read-only mapping of setting name to parsed value
+    """
+    values = {}
+    for key, (parse, default) in _ENV_SPEC.items():
+        raw = os.getenv(key)
+        if raw is None:
+            values[key] = default
+            continue
+        try:
+            values[key] = parse(raw)
+        except ValueError:
+            warnings.warn(f"Invalid {key} value: {raw}, using default {default}")
+            values[key] = default
+    return MappingProxyType(values)
 
-@dataclass
+
+@dataclass(frozen=True)
 class ClaudeConfig:
     """Claude AI API configuration.
 
@@ -52,20 +125,13 @@ class ClaudeConfig:
         Returns:
             ClaudeConfig instance populated from environment
         """
-        max_tokens_str = os.getenv('MAX_TOKENS', str(DEFAULT_MAX_TOKENS))
-        try:
-            max_tokens = int(max_tokens_str)
-        except ValueError:
-            warnings.warn(f"Invalid MAX_TOKENS value: {max_tokens_str}, using default")
-            max_tokens = DEFAULT_MAX_TOKENS
-
         return cls(
             api_key=os.getenv('ANTHROPIC_API_KEY', ''),
             model=os.getenv('CLAUDE_MODEL', DEFAULT_CLAUDE_MODEL),
-            max_tokens=max_tokens
+            max_tokens=_parse_env()['MAX_TOKENS']
         )
 
-@dataclass
+@dataclass(frozen=True)
 class ShopifyConfig:
     """Shopify API configuration.
 
@@ -108,7 +174,7 @@ class ShopifyConfig:
             api_version=os.getenv('SHOPIFY_API_VERSION', DEFAULT_SHOPIFY_API_VERSION)
         )
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
     """Database configuration.
 
@@ -119,6 +185,10 @@ class DatabaseConfig:
         user: Database username
         password: Database password
     """
+    # Declared by hand since dataclass(slots=True) needs Python 3.10;
+    # keep in sync with the fields below
+    __slots__ = ('host', 'port', 'database', 'user', 'password', 'connection_string')
+
     host: str
     port: int
     database: str
@@ -126,20 +196,18 @@ class DatabaseConfig:
     password: str
 
     def __post_init__(self) -> None:
-        """Validate database configuration."""
+        """Validate database configuration and build the connection string."""
         if not self.password:
             warnings.warn("MYSQL_PASSWORD is not set", UserWarning)
         if self.port < 1 or self.port > 65535:
             raise ValueError(f"Invalid port number: {self.port}")
 
-    @property
-    def connection_string(self) -> str:
-        """Generate SQLAlchemy connection string.
-
-        Returns:
-            MySQL connection string for SQLAlchemy
-        """
-        return f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        # SQLAlchemy connection string, built once since the config is frozen
+        object.__setattr__(
+            self,
+            'connection_string',
+            f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        )
 
     @classmethod
     def from_env(cls) -> 'DatabaseConfig':
@@ -148,22 +216,15 @@ class DatabaseConfig:
         Returns:
             DatabaseConfig instance populated from environment
         """
-        port_str = os.getenv('MYSQL_PORT', str(DEFAULT_MYSQL_PORT))
-        try:
-            port = int(port_str)
-        except ValueError:
-            warnings.warn(f"Invalid MYSQL_PORT value: {port_str}, using default")
-            port = DEFAULT_MYSQL_PORT
-
         return cls(
             host=os.getenv('MYSQL_HOST', 'localhost'),
-            port=port,
+            port=_parse_env()['MYSQL_PORT'],
             database=os.getenv('MYSQL_DATABASE', 'linoroso_automation'),
             user=os.getenv('MYSQL_USER', 'root'),
             password=os.getenv('MYSQL_PASSWORD', '')
         )
 
-@dataclass
+@dataclass(frozen=True)
 class BrandConfig:
     """Linoroso brand configuration.
 
@@ -196,7 +257,7 @@ class BrandConfig:
             'MAIN_CATEGORIES',
             'kitchen knives,kitchen shears,knife sets,storage solutions'
         )
-        main_categories = [cat.strip() for cat in categories_str.split(',') if cat.strip()]
+        main_categories = [cat for cat in _CATEGORY_SPLIT_RE.split(categories_str.strip()) if cat]
 
         return cls(
             name=os.getenv('BRAND_NAME', 'Linoroso'),
@@ -206,7 +267,7 @@ class BrandConfig:
             main_categories=main_categories
         )
 
-@dataclass
+@dataclass(frozen=True)
 class ContentConfig:
     """Content generation configuration.
 
@@ -240,23 +301,17 @@ class ContentConfig:
         Returns:
             ContentConfig instance populated from environment
         """
-        # Parse integer values with error handling
-        def parse_int(key: str, default: int) -> int:
-            try:
-                return int(os.getenv(key, str(default)))
-            except ValueError:
-                warnings.warn(f"Invalid {key} value, using default {default}")
-                return default
+        env = _parse_env()
 
         return cls(
             output_path=Path(os.getenv('CONTENT_OUTPUT_PATH', './data/generated_content')),
             frequency=os.getenv('BLOG_POST_FREQUENCY', 'daily'),
-            min_word_count=parse_int('MIN_WORD_COUNT', DEFAULT_MIN_WORD_COUNT),
-            max_word_count=parse_int('MAX_WORD_COUNT', DEFAULT_MAX_WORD_COUNT),
-            posts_per_day=parse_int('SOCIAL_POSTS_PER_DAY', DEFAULT_SOCIAL_POSTS_PER_DAY)
+            min_word_count=env['MIN_WORD_COUNT'],
+            max_word_count=env['MAX_WORD_COUNT'],
+            posts_per_day=env['SOCIAL_POSTS_PER_DAY']
         )
 
-@dataclass
+@dataclass(frozen=True)
 class InfluencerConfig:
     """Influencer program configuration.
 
@@ -289,27 +344,87 @@ class InfluencerConfig:
         Returns:
             InfluencerConfig instance populated from environment
         """
-        def parse_int(key: str, default: int) -> int:
-            try:
-                return int(os.getenv(key, str(default)))
-            except ValueError:
-                warnings.warn(f"Invalid {key} value, using default {default}")
-                return default
-
-        def parse_float(key: str, default: float) -> float:
-            try:
-                return float(os.getenv(key, str(default)))
-            except ValueError:
-                warnings.warn(f"Invalid {key} value, using default {default}")
-                return default
+        env = _parse_env()
+
+        return cls(
+            outreach_limit=env['INFLUENCER_OUTREACH_LIMIT'],
+            min_follower_count=env['MIN_FOLLOWER_COUNT'],
+            min_engagement_rate=env['MIN_ENGAGEMENT_RATE'],
+            commission_basic=env['COMMISSION_BASIC'],
+            commission_intermediate=env['COMMISSION_INTERMEDIATE'],
+            commission_advanced=env['COMMISSION_ADVANCED']
+        )
+
+@dataclass(frozen=True)
+class RedisConfig:
+    """Redis configuration.
+
+    Attributes:
+        host: Redis server hostname
+        port: Redis server port
+        db: Redis database number
+        url: Full Redis URL; overrides host, port, and db when set
+    """
+    host: str = "localhost"
+    port: int = DEFAULT_REDIS_PORT
+    db: int = 0
+    url: str = ""
+
+    @property
+    def connection_url(self) -> str:
+        """Generate Redis connection URL.
+
+        Returns:
+            Redis URL for redis-py
+        """
+        return self.url or f"redis://{self.host}:{self.port}/{self.db}"
+
+    @classmethod
+    def from_env(cls) -> 'RedisConfig':
+        """Create configuration from environment variables.
+
+        Returns:
+            RedisConfig instance populated from environment
+        """
+        env = _parse_env()
+
+        return cls(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=env['REDIS_PORT'],
+            db=env['REDIS_DB'],
+            url=os.getenv('REDIS_URL', '')
+        )
+
+@dataclass(frozen=True)
+class DataSourceConfig:
+    """Input data file configuration.
+
+    Attributes:
+        pages_csv_path: Google Search Console pages export
+        queries_csv_path: Google Search Console queries export
+        products_csv_path: Shopify products export
+        local_cache_dir: Optional local directory to mirror the exports into
+            before reading, for sources on slow or network-mounted storage
+    """
+    pages_csv_path: Path = Path(DEFAULT_PAGES_CSV_PATH)
+    queries_csv_path: Path = Path(DEFAULT_QUERIES_CSV_PATH)
+    products_csv_path: Path = Path(DEFAULT_PRODUCTS_CSV_PATH)
+    local_cache_dir: Optional[Path] = None
+
+    @classmethod
+    def from_env(cls) -> 'DataSourceConfig':
+        """Create configuration from environment variables.
+
+        Returns:
+            DataSourceConfig instance populated from environment
+        """
+        local_cache_dir = os.getenv('LOCAL_CSV_CACHE_DIR', '')
 
         return cls(
-            outreach_limit=parse_int('INFLUENCER_OUTREACH_LIMIT', 50),
-            min_follower_count=parse_int('MIN_FOLLOWER_COUNT', 10000),
-            min_engagement_rate=parse_float('MIN_ENGAGEMENT_RATE', 3.0),
-            commission_basic=parse_int('COMMISSION_BASIC', 10),
-            commission_intermediate=parse_int('COMMISSION_INTERMEDIATE', 15),
-            commission_advanced=parse_int('COMMISSION_ADVANCED', 20)
+            pages_csv_path=Path(os.getenv('PAGES_CSV_PATH', DEFAULT_PAGES_CSV_PATH)),
+            queries_csv_path=Path(os.getenv('QUERIES_CSV_PATH', DEFAULT_QUERIES_CSV_PATH)),
+            products_csv_path=Path(os.getenv('PRODUCTS_CSV_PATH', DEFAULT_PRODUCTS_CSV_PATH)),
+            local_cache_dir=Path(local_cache_dir) if local_cache_dir else None
         )
 
 class Config:
@@ -317,6 +432,8 @@ class Config:
 
     This class loads and manages all configuration from environment variables,
     organizing them into logical groups for easy access throughout the application.
+    Sub-configurations are built on first access, so a caller that needs one
+    group does not pay for parsing and validating the others.
 
     Attributes:
         environment: Application environment (development, staging, production)
@@ -328,6 +445,8 @@ class Config:
         brand: Brand-specific settings
         content: Content generation settings
         influencer: Influencer program settings
+        data_sources: Input data file locations
+        redis: Redis connection settings
         instagram_username: Instagram API username
         instagram_password: Instagram API password
         tiktok_session_id: TikTok API session ID
@@ -343,42 +462,76 @@ class Config:
 
     def __init__(self) -> None:
         """Initialize configuration from environment variables."""
-        self.environment: str = os.getenv('ENVIRONMENT', 'development')
-        self.debug: bool = os.getenv('DEBUG', 'False').lower() == 'true'
-        self.log_level: str = os.getenv('LOG_LEVEL', 'INFO')
-
-        # Load sub-configurations
-        self.claude: ClaudeConfig = ClaudeConfig.from_env()
-        self.shopify: ShopifyConfig = ShopifyConfig.from_env()
-        self.database: DatabaseConfig = DatabaseConfig.from_env()
-        self.brand: BrandConfig = BrandConfig.from_env()
-        self.content: ContentConfig = ContentConfig.from_env()
-        self.influencer: InfluencerConfig = InfluencerConfig.from_env()
+        getenv = os.getenv  # Local alias for the run of lookups below
+
+        self.environment: str = getenv('ENVIRONMENT', 'development')
+        self.debug: bool = getenv('DEBUG', 'False').lower() == 'true'
+        self.log_level: str = getenv('LOG_LEVEL', 'INFO')
 
         # Social media credentials
-        self.instagram_username: str = os.getenv('INSTAGRAM_USERNAME', '')
-        self.instagram_password: str = os.getenv('INSTAGRAM_PASSWORD', '')
-        self.tiktok_session_id: str = os.getenv('TIKTOK_SESSION_ID', '')
-        self.pinterest_token: str = os.getenv('PINTEREST_ACCESS_TOKEN', '')
+        self.instagram_username: str = getenv('INSTAGRAM_USERNAME', '')
+        self.instagram_password: str = getenv('INSTAGRAM_PASSWORD', '')
+        self.tiktok_session_id: str = getenv('TIKTOK_SESSION_ID', '')
+        self.pinterest_token: str = getenv('PINTEREST_ACCESS_TOKEN', '')
 
         # Email marketing
-        self.klaviyo_api_key: str = os.getenv('KLAVIYO_API_KEY', '')
+        self.klaviyo_api_key: str = getenv('KLAVIYO_API_KEY', '')
 
         # Analytics
-        self.google_analytics_id: str = os.getenv('GOOGLE_ANALYTICS_PROPERTY_ID', '')
-        self.google_credentials_path: str = os.getenv(
+        self.google_analytics_id: str = getenv('GOOGLE_ANALYTICS_PROPERTY_ID', '')
+        self.google_credentials_path: str = getenv(
             'GOOGLE_CREDENTIALS_PATH',
             './config/google-credentials.json'
         )
 
         # Monitoring and alerting
-        self.sentry_dsn: str = os.getenv('SENTRY_DSN', '')
-        self.slack_webhook: str = os.getenv('SLACK_WEBHOOK_URL', '')
-        self.alert_email: str = os.getenv('ALERT_EMAIL', 'tony@linoroso.com')
+        self.sentry_dsn: str = getenv('SENTRY_DSN', '')
+        self.slack_webhook: str = getenv('SLACK_WEBHOOK_URL', '')
+        self.alert_email: str = getenv('ALERT_EMAIL', 'tony@linoroso.com')
 
         # SEO tools
-        self.serpapi_key: str = os.getenv('SERPAPI_KEY', '')
+        self.serpapi_key: str = getenv('SERPAPI_KEY', '')
         
+    @cached_property
+    def claude(self) -> ClaudeConfig:
+        """Claude AI configuration."""
+        return ClaudeConfig.from_env()
+
+    @cached_property
+    def shopify(self) -> ShopifyConfig:
+        """Shopify API configuration."""
+        return ShopifyConfig.from_env()
+
+    @cached_property
+    def database(self) -> DatabaseConfig:
+        """Database configuration."""
+        return DatabaseConfig.from_env()
+
+    @cached_property
+    def brand(self) -> BrandConfig:
+        """Brand-specific settings."""
+        return BrandConfig.from_env()
+
+    @cached_property
+    def content(self) -> ContentConfig:
+        """Content generation settings."""
+        return ContentConfig.from_env()
+
+    @cached_property
+    def influencer(self) -> InfluencerConfig:
+        """Influencer program settings."""
+        return InfluencerConfig.from_env()
+
+    @cached_property
+    def data_sources(self) -> DataSourceConfig:
+        """Input data file locations."""
+        return DataSourceConfig.from_env()
+
+    @cached_property
+    def redis(self) -> RedisConfig:
+        """Redis connection settings."""
+        return RedisConfig.from_env()
+
     def validate(self) -> List[str]:
         """Validate required configuration and return list of missing items.
 
@@ -433,14 +586,52 @@ class Config:
         }
 
 
-# Global configuration instance
-config = Config()
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Return the shared configuration, building it on first call.
+
+    Returns:
+        Shared Config instance
+    """
+    return Config()
+
+
+def check_config() -> List[str]:
+    """Validate the shared configuration and warn about missing settings.
+
+    Called once by application entry points rather than on import, so
+    modules and tools that only import settings skip the validation.
 
-# Validate on import
-missing_config = config.validate()
-if missing_config and not config.is_development:
-    warnings.warn(
-        f"Missing required configuration: {', '.join(missing_config)}. "
-        "Application may not function correctly.",
-        UserWarning
-    )
+    Returns:
+        List of missing or invalid configuration items
+    """
+    instance = get_config()
+
+    missing_config = instance.validate()
+    if missing_config and not instance.is_development:
+        warnings.warn(
+            f"Missing required configuration: {', '.join(missing_config)}. "
+            "Application may not function correctly.",
+            UserWarning
+        )
+
+    return missing_config
+
+
+def __getattr__(name: str) -> Config:
+    """Create the global ``config`` instance on first access (PEP 562).
+
+    Args:
+        name: Module attribute being looked up
+
+    Returns:
+        Shared Config instance when ``name`` is 'config'
+
+    Raises:
+        AttributeError: For any other missing attribute
+    """
+    if name == 'config':
+        # Bind it as a real global so later lookups skip this hook
+        globals()['config'] = get_config()
+        return globals()['config']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,13 +4,22 @@ Linoroso Shopify Automation - Setup Script
 Automated setup and validation of the marketing automation system
 """
 
+import importlib.util
 import os
+import re
 import sys
 from pathlib import Path
-import subprocess
-import json
 from typing import List, Tuple
 
+CRITICAL_ENV_KEYS = ('ANTHROPIC_API_KEY', 'SHOPIFY_STORE_URL', 'SHOPIFY_ACCESS_TOKEN')
+
+# KEY=value lines whose value is non-empty and not a 'your_...' placeholder
+CONFIGURED_KEY_RE = re.compile(
+    r'^[ \t]*(' + '|'.join(map(re.escape, CRITICAL_ENV_KEYS)) + r')[ \t]*=[ \t]*'
+    r'(?![\'"]?your_)[\'"]?[^\s\'"#]',
+    re.MULTILINE
+)
+
 class SetupAssistant:
     """Interactive setup assistant"""
     
@@ -48,13 +57,10 @@ class SetupAssistant:
     def check_required_packages(self) -> Tuple[bool, str]:
         """Check if required packages can be imported"""
         required = ['anthropic', 'pandas', 'requests', 'loguru']
-        missing = []
         
-        for package in required:
-            try:
-                __import__(package)
-            except ImportError:
-                missing.append(package)
+        # find_spec only locates the package; importing would run pandas'
+        # whole import chain just to prove it exists
+        missing = [package for package in required if importlib.util.find_spec(package) is None]
         
         if not missing:
             return True, "Required packages installed ✓"
@@ -68,9 +74,11 @@ class SetupAssistant:
             'data/generated_content', 'data/social_posts'
         ]
         
-        for dir_name in required_dirs:
-            dir_path = self.project_root / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
+        # Parents sort before their children, so each mkdir needs no
+        # upward walk and shared parents are created once
+        dir_paths = sorted({self.project_root / d for d in required_dirs}, key=lambda p: len(p.parts))
+        for dir_path in dir_paths:
+            dir_path.mkdir(exist_ok=True)
         
         return True, "Directory structure created ✓"
     
@@ -81,20 +89,10 @@ class SetupAssistant:
         if not env_path.exists():
             return False, "No .env file ✗"
         
-        # Read .env file
-        with open(env_path, 'r') as f:
-            env_content = f.read()
-        
-        critical_keys = [
-            'ANTHROPIC_API_KEY',
-            'SHOPIFY_STORE_URL',
-            'SHOPIFY_ACCESS_TOKEN'
-        ]
-        
-        missing = []
-        for key in critical_keys:
-            if key not in env_content or f'{key}=your_' in env_content:
-                missing.append(key)
+        # One regex sweep over the file; python-dotenv may not be installed
+        # yet, since this check runs before dependencies are
+        configured = {match.group(1) for match in CONFIGURED_KEY_RE.finditer(env_path.read_text())}
+        missing = [key for key in CRITICAL_ENV_KEYS if key not in configured]
         
         if not missing:
             return True, "API keys configured ✓"
@@ -120,6 +118,9 @@ class SetupAssistant:
             status = "✓" if success else "✗"
             print(f"{status} {check_name}: {message}")
         
+        # Keep results so later setup steps can reuse them
+        self.checks = results
+        
         all_passed = all(r[1] for r in results)
         
         if all_passed:
@@ -139,10 +140,19 @@ class SetupAssistant:
             print("❌ requirements.txt not found!")
             return False
         
+        import subprocess
+        
         print("Installing packages from requirements.txt...")
         try:
+            # Prefer wheels and keep a project-local cache so repeat setups
+            # skip source builds and downloads
             subprocess.run(
-                [sys.executable, '-m', 'pip', 'install', '-r', str(requirements_file)],
+                [
+                    sys.executable, '-m', 'pip', 'install',
+                    '--prefer-binary', '--no-compile',
+                    '--cache-dir', str(self.project_root / '.pip-cache'),
+                    '-r', str(requirements_file)
+                ],
                 check=True
             )
             print("✅ Dependencies installed successfully!")
@@ -198,19 +208,34 @@ class SetupAssistant:
         # Update .env file
         env_path = self.project_root / '.env'
         if env_path.exists():
-            with open(env_path, 'r') as f:
-                lines = f.readlines()
+            replacements = {
+                key: value for key, value in (
+                    ('ANTHROPIC_API_KEY', anthropic_key),
+                    ('SHOPIFY_STORE_URL', shopify_url),
+                    ('SHOPIFY_ACCESS_TOKEN', shopify_token)
+                ) if value
+            }
             
-            with open(env_path, 'w') as f:
-                for line in lines:
-                    if anthropic_key and line.startswith('ANTHROPIC_API_KEY='):
-                        f.write(f'ANTHROPIC_API_KEY={anthropic_key}\n')
-                    elif shopify_url and line.startswith('SHOPIFY_STORE_URL='):
-                        f.write(f'SHOPIFY_STORE_URL={shopify_url}\n')
-                    elif shopify_token and line.startswith('SHOPIFY_ACCESS_TOKEN='):
-                        f.write(f'SHOPIFY_ACCESS_TOKEN={shopify_token}\n')
-                    else:
-                        f.write(line)
+            # Stream through a temp file and swap it in, so an interrupted
+            # write never leaves a truncated .env behind
+            if replacements:
+                import tempfile
+                
+                with open(env_path, 'r') as src, tempfile.NamedTemporaryFile(
+                    'w', dir=env_path.parent, prefix='.env.', suffix='.tmp', delete=False
+                ) as dst:
+                    try:
+                        for line in src:
+                            key = line.split('=', 1)[0]
+                            if key in replacements and '=' in line:
+                                dst.write(f'{key}={replacements[key]}\n')
+                            else:
+                                dst.write(line)
+                    except BaseException:
+                        dst.close()
+                        os.unlink(dst.name)
+                        raise
+                os.replace(dst.name, env_path)
             
             if anthropic_key or shopify_url or shopify_token:
                 print("\n✅ API keys configured!")
@@ -225,8 +250,7 @@ class SetupAssistant:
         
         try:
             # Import after ensuring packages are installed
-            sys.path.insert(0, str(self.project_root))
-            from src.content_generation.content_engine import ContentGenerator
+            from content_engine import ContentGenerator
             
             generator = ContentGenerator()
             
@@ -267,7 +291,8 @@ class SetupAssistant:
             sys.exit(1)
         
         # Step 1: Install dependencies
-        if not self.check_required_packages()[0]:
+        packages_ok = next(success for name, success, _ in self.checks if name == "Required Packages")
+        if not packages_ok:
             self.install_dependencies()
         
         # Step 2: Create .env
@@ -0,0 +1,121 @@
+"""
+File Storage Helpers.
+
+Shared JSON persistence for reports, caches, and logs. Writes go to a
+temporary file next to the target and are moved into place with
+``os.replace``, so a crash or Ctrl-C never leaves a truncated file behind.
+``file_lock`` serializes read-modify-write updates of files shared between
+processes.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock
+    fcntl = None
+
+# Constants
+COMPACT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+JSON_OPTIONS = COMPACT_JSON_OPTIONS | orjson.OPT_INDENT_2
+JSONL_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+
+# mkstemp creates files as 0600; new files get the mode open() would give
+# them instead. The umask can only be read by setting it, so do it once here.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+DEFAULT_FILE_MODE = 0o666 & ~_UMASK
+
+
+def write_json_atomic(path: Path, obj: Any, indent: bool = True,
+                      mode: Optional[int] = None) -> Path:
+    """Serialize an object to JSON and atomically replace the target file.
+
+    Args:
+        path: Destination file path
+        obj: JSON-serializable object (numpy scalars and datetimes allowed)
+        indent: Pretty-print with two-space indentation; pass False for
+            compact output on large machine-read files
+        mode: Permission bits for the file (see ``write_bytes_atomic``)
+
+    Returns:
+        Path to the written file
+    """
+    option = JSON_OPTIONS if indent else COMPACT_JSON_OPTIONS
+    return write_bytes_atomic(path, orjson.dumps(obj, option=option), mode=mode)
+
+
+def write_bytes_atomic(path: Path, data: bytes, mode: Optional[int] = None) -> Path:
+    """Write bytes to a temporary file and atomically replace the target.
+
+    Args:
+        path: Destination file path
+        data: File contents
+        mode: Permission bits for the file; defaults to the existing file's
+            mode, or DEFAULT_FILE_MODE for a new file
+
+    Returns:
+        Path to the written file
+    """
+    if mode is None:
+        try:
+            mode = os.stat(path).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = DEFAULT_FILE_MODE
+
+    # Unique temp name so concurrent writers of the same file never interleave
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return path
+
+
+def append_jsonl(path: Path, obj: Any) -> int:
+    """Append an object as a single JSON line.
+
+    Args:
+        path: JSONL file path
+        obj: JSON-serializable object
+
+    Returns:
+        File size in bytes after the append
+    """
+    with open(path, 'ab') as f:
+        f.write(orjson.dumps(obj, option=JSONL_OPTIONS))
+        return f.tell()
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a file for a read-modify-write update.
+
+    The lock is an advisory ``flock`` on a ``.lock`` file next to the
+    target, so it only excludes other writers that also use ``file_lock``.
+    Where ``fcntl`` is unavailable the block runs unlocked.
+
+    Args:
+        path: File about to be updated
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(path.with_name(f'{path.name}.lock'), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,52 @@
+"""Tests for the automation coordinator's persistence helpers."""
+
+import threading
+from collections import deque
+
+import orjson
+import pytest
+
+pytest.importorskip('schedule')
+
+import main
+from main import LinorosoAutomation
+
+
+@pytest.fixture
+def automation(monkeypatch, tmp_path):
+    """Coordinator writing its logs under tmp_path, without starting any engines."""
+    monkeypatch.setattr(main, 'LOGS_DIR', tmp_path)
+    monkeypatch.setattr(main, 'EXECUTION_ITEMS_FILE', tmp_path / 'execution_items.csv')
+    monkeypatch.setattr(main, 'MAX_LOG_ENTRIES', 3)
+
+    instance = LinorosoAutomation.__new__(LinorosoAutomation)
+    instance.execution_log = deque(maxlen=main.MAX_LOG_ENTRIES)
+    instance._log_lock = threading.Lock()
+    return instance
+
+
+def read_log(path):
+    """Parse a JSONL execution log."""
+    return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
+def test_log_execution_appends_until_compaction_threshold(automation, monkeypatch, tmp_path):
+    monkeypatch.setattr(main, 'LOG_COMPACT_BYTES', 1 << 20)
+
+    for run in range(5):
+        automation._log_execution('content', {'run': run})
+
+    entries = read_log(tmp_path / 'execution_log.jsonl')
+    assert [entry['details']['run'] for entry in entries] == [0, 1, 2, 3, 4]
+    assert [entry['details']['run'] for entry in automation.execution_log] == [2, 3, 4]
+
+
+def test_log_execution_compacts_to_most_recent_entries(automation, monkeypatch, tmp_path):
+    monkeypatch.setattr(main, 'LOG_COMPACT_BYTES', 0)
+
+    for run in range(5):
+        automation._log_execution('content', {'run': run})
+
+    entries = read_log(tmp_path / 'execution_log.jsonl')
+    assert [entry['details']['run'] for entry in entries] == [2, 3, 4]
+    assert all(entry['task'] == 'content' for entry in entries)
@@ -0,0 +1,237 @@
+"""Tests for the product listing optimizer."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+import optimizer
+from llm_cache import LLMCache
+from content_engine import GeneratedContent
+from optimizer import Product, ProductOptimizer
+
+CATEGORIES = ['Knife', 'Knife Sets', 'Cutting Boards']
+
+
+class FakeContentGenerator:
+    """Stand-in for ContentGenerator that never calls the API."""
+
+    model = 'test-model'
+
+
+@pytest.fixture
+def product_optimizer(monkeypatch, tmp_path):
+    """ProductOptimizer with fixed brand categories and a temporary LLM cache."""
+    brand = SimpleNamespace(name='Linoroso', main_categories=CATEGORIES)
+    monkeypatch.setattr(optimizer, 'config', SimpleNamespace(brand=brand))
+    monkeypatch.setattr(optimizer, 'ContentGenerator', FakeContentGenerator)
+
+    class TempLLMCache(LLMCache):
+        def __init__(self) -> None:
+            super().__init__(tmp_path / 'llm.sqlite3')
+
+    monkeypatch.setattr(optimizer, 'LLMCache', TempLLMCache)
+    return ProductOptimizer()
+
+
+def make_product(**overrides) -> Product:
+    """Build a Product with sensible defaults."""
+    fields = {
+        'handle': 'chef-knife',
+        'title': 'Linoroso 8 Inch Chef Knife',
+        'description': '<p>Sharp German steel chef knife.</p>',
+        'vendor': 'Linoroso',
+        'product_type': 'Kitchen Knives',
+        'tags': ['knife', 'chef'],
+        'price': 49.99,
+        'sku': 'LK-8',
+        'images': ['https://example.com/knife.jpg']
+    }
+    fields.update(overrides)
+    return Product(**fields)
+
+
+def test_description_cache_key_changes_with_description(product_optimizer):
+    keywords = ['knife', 'linoroso']
+    original = make_product()
+    edited = make_product(description='<p>Now forged from Damascus steel.</p>')
+
+    original_key = product_optimizer._description_cache_key(original, keywords)
+    product_optimizer.llm_cache.set(original_key, {'content': 'cached'})
+
+    edited_key = product_optimizer._description_cache_key(edited, keywords)
+    assert edited_key != original_key
+    assert product_optimizer.llm_cache.get(edited_key) is None
+    assert product_optimizer._description_cache_key(make_product(), keywords) == original_key
+
+
+def test_optimize_product_reuses_cached_description(product_optimizer):
+    calls = []
+
+    def generate_product_description(product_name, keywords, product_details):
+        calls.append(product_details['current_description'])
+        return GeneratedContent(
+            title=product_name,
+            content=f'# Optimized {product_name}\n<p>New copy.</p>',
+            meta_description='meta',
+            keywords=keywords,
+            word_count=3,
+            created_at=datetime(2024, 1, 1),
+            content_type='product_description'
+        )
+
+    product_optimizer.content_generator.generate_product_description = generate_product_description
+
+    first = product_optimizer.optimize_product(make_product())
+    second = product_optimizer.optimize_product(make_product())
+    assert len(calls) == 1
+    assert second.optimized_description == first.optimized_description
+
+    product_optimizer.optimize_product(make_product(description='<p>Damascus steel.</p>'))
+    assert calls == ['<p>Sharp German steel chef knife.</p>', '<p>Damascus steel.</p>']
+
+def test_match_categories_finds_categories_sharing_a_prefix(product_optimizer):
+    matched = product_optimizer._match_categories('Linoroso 15-Piece KNIFE SETS with Block')
+
+    assert matched == {'knife', 'knife sets'}
+
+
+def test_extract_keywords_keeps_every_matched_category(product_optimizer):
+    product = make_product(
+        title='Linoroso Knife Sets',
+        description='<p>Pairs well with our cutting boards.</p>',
+        product_type='',
+        tags=[]
+    )
+
+    keywords = product_optimizer._extract_keywords(product)
+
+    assert keywords[:3] == ['Knife', 'Knife Sets', 'Cutting Boards']
+
+
+def write_export(path, count):
+    """Write a minimal Shopify export with ``count`` products."""
+    pd.DataFrame({
+        'Handle': [f'product-{i}' for i in range(count)],
+        'Title': [f'Linoroso Chef Knife {i}' for i in range(count)],
+        'Body (HTML)': ['<p>Sharp.</p>'] * count,
+        'Type': ['Kitchen Knives'] * count,
+        'Tags': ['knife'] * count,
+        'Variant Price': ['49.99'] * count,
+        'Image Src': ['https://example.com/knife.jpg'] * count
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_iter_optimized_products_bounds_batches_in_flight(product_optimizer, monkeypatch, tmp_path):
+    monkeypatch.setattr(optimizer, 'PRODUCT_BATCH_SIZE', 1)
+    monkeypatch.setattr(optimizer, 'OPTIMIZATION_WINDOW', 2)
+    submitted = []
+
+    def fake_optimize_batch(batch, created_at):
+        submitted.append(batch[0][1].handle)
+        return [SimpleNamespace(product_handle=product.handle) for _, product, _ in batch]
+
+    monkeypatch.setattr(product_optimizer, '_optimize_batch', fake_optimize_batch)
+    results = product_optimizer.iter_optimized_products(write_export(tmp_path / 'products.csv', 10))
+
+    first = next(results)
+    assert first.product_handle == 'product-0'
+    assert len(submitted) <= 3
+
+    handles = [first.product_handle] + [result.product_handle for result in results]
+    assert handles == [f'product-{i}' for i in range(10)]
+
+
+def test_analyze_products_batch_matches_analyze_product(product_optimizer, tmp_path):
+    pd.DataFrame({
+        'Handle': ['good', 'short', 'bare', 'no-price'],
+        'Title': [
+            'Linoroso Knife Sets 15 Piece German Steel Block Set for Home Chefs',
+            'Chef Knife',
+            'Linoroso Cutting Boards',
+            'Linoroso Knife Sets'
+        ],
+        'Body (HTML)': ['<P class="lead">' + 'x' * 400, '<div>Sharp</div>', 'Bamboo', 'plain text'],
+        'Type': ['Knife Sets', 'Knives', None, 'Knife Sets'],
+        'Tags': ['a,b,c,d,e', 'a', None, 'a,b'],
+        'Variant Price': ['99.99', '20', '15', None],
+        'Image Src': ['https://example.com/1.jpg', None, 'https://example.com/2.jpg', None]
+    }).to_csv(tmp_path / 'products.csv', index=False)
+    products_df = product_optimizer._load_products(tmp_path / 'products.csv')
+
+    batch = product_optimizer.analyze_products_batch(products_df).to_dict('records')
+
+    for row, scored in zip(products_df.to_dict('records'), batch):
+        product = Product.from_shopify_export(row)
+        single = product_optimizer.analyze_product(product)
+        assert scored['Handle'] == product.handle
+        for name in ('score', 'title_length', 'description_length', 'tag_count', 'image_count'):
+            assert scored[name] == single[name], (product.handle, name)
+
+
+def test_iter_batches_keeps_already_optimized_listings_out_of_llm_slots(product_optimizer, monkeypatch):
+    monkeypatch.setattr(optimizer, 'PRODUCT_BATCH_SIZE', 2)
+    flags = [True, False, True, False, False, True, True]
+    items = [(idx, make_product(handle=f'p{idx}'), {'already_optimized': flag})
+             for idx, flag in enumerate(flags)]
+
+    batches = list(product_optimizer._iter_batches(items))
+
+    assert [[idx for idx, _, _ in batch] for batch in batches] == [[0, 1, 2], [3, 4], [5, 6]]
+
+
+def make_optimized_product(**overrides) -> Product:
+    """Build a Product whose listing already meets the post-optimization bar."""
+    fields = {
+        'title': 'Linoroso 8 Inch Chef Knife, German High Carbon Steel Kitchen Blade',
+        'description': '<p>' + 'Hand-sharpened German steel. ' * 12 + '</p>',
+        'tags': ['knife', 'chef', 'kitchen', 'german steel', 'gift'],
+        'images': ['1.jpg', '2.jpg', '3.jpg']
+    }
+    fields.update(overrides)
+    return make_product(**fields)
+
+
+def test_optimize_product_skips_already_optimized_listing(product_optimizer):
+    product = make_optimized_product()
+
+    # FakeContentGenerator has no generation methods, so any LLM call would raise
+    result = product_optimizer.optimize_product(product)
+
+    assert result.improvement_notes == ['Already optimized']
+    assert result.optimized_description == product.description
+    assert not result.changed
+
+
+def test_optimization_report_counts_only_changed_listings(product_optimizer, tmp_path):
+    skipped = product_optimizer.optimize_product(make_optimized_product(handle='good'))
+    updated = optimizer.OptimizationResult(
+        product_handle='rewritten',
+        original_title='Knife',
+        optimized_title='Linoroso Chef Knife',
+        original_description='old',
+        optimized_description='<p>new</p>',
+        meta_description='meta',
+        suggested_tags=['knife'],
+        seo_score=90.0,
+        improvement_notes=[],
+        created_at=datetime.now()
+    )
+
+    report_path = product_optimizer.generate_optimization_report(
+        [skipped, updated], tmp_path / 'report.json'
+    )
+
+    report = orjson.loads(report_path.read_bytes())
+    assert report['total_products_optimized'] == 1
+    assert report['products_already_optimized'] == 1
+    assert report['summary'] == {
+        'avg_improvement': 90.0,
+        'products_with_title_changes': 1,
+        'products_with_new_descriptions': 1
+    }
+    assert [row['handle'] for row in report['optimizations']] == ['rewritten']
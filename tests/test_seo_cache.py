@@ -0,0 +1,44 @@
+"""Tests for the Redis-backed SEO response cache."""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('orjson')
+
+import seo_cache
+
+
+@pytest.fixture
+def unreachable_redis(monkeypatch):
+    """Fake redis module whose server never answers; records connect attempts."""
+    attempts = []
+    lock = threading.Lock()
+
+    class Redis:
+        @classmethod
+        def from_url(cls, url, **kwargs):
+            with lock:
+                attempts.append(url)
+            return cls()
+
+        def ping(self):
+            time.sleep(0.05)
+            raise ConnectionError('connection refused')
+
+    monkeypatch.setitem(sys.modules, 'redis', SimpleNamespace(Redis=Redis))
+    monkeypatch.setattr(seo_cache, '_client', None)
+    monkeypatch.setattr(seo_cache, '_disabled', False)
+    return attempts
+
+
+def test_concurrent_lookups_connect_once(unreachable_redis):
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        values = list(executor.map(seo_cache.get, [f'serp:{i}' for i in range(16)]))
+
+    assert values == [None] * 16
+    assert len(unreachable_redis) == 1
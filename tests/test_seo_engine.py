@@ -0,0 +1,28 @@
+"""Tests for the SEO keyword engine."""
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('requests')
+
+from lexicon import TermMatcher
+from seo_engine import SEOAutomation
+
+
+def test_count_terms_counts_terms_sharing_a_prefix():
+    lower = pd.Series(['best knife sets 2024', 'knife sharpener', 'cutting board'], dtype=object)
+    matcher = TermMatcher(('knife', 'knife sets', 'knife block'))
+
+    counts = SEOAutomation._count_terms(lower, matcher)
+
+    assert counts.tolist() == [2, 1, 0]
+
+
+def test_term_matcher_finds_overlapping_terms_ignoring_case():
+    matcher = TermMatcher(['Knife', 'Knife Sets', 'Cutting Boards'], ignore_case=True)
+
+    assert matcher.find('15-Piece KNIFE SETS and Cutting Boards') == {
+        'knife', 'knife sets', 'cutting boards'
+    }
+    assert matcher.find('Chef Knives') == set()
+    assert TermMatcher([]).find('anything') == set()
@@ -0,0 +1,65 @@
+"""Tests for the atomic file storage helpers."""
+
+import os
+import stat
+
+import pytest
+
+orjson = pytest.importorskip('orjson')
+
+import storage
+
+
+def file_mode(path):
+    """Permission bits of a file."""
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_write_json_atomic_replaces_file_without_leftovers(tmp_path):
+    path = tmp_path / 'report.json'
+    path.write_text('stale')
+
+    storage.write_json_atomic(path, {'score': 90.0, 1: 'non-string key'})
+
+    assert orjson.loads(path.read_bytes()) == {'score': 90.0, '1': 'non-string key'}
+    assert os.listdir(tmp_path) == ['report.json']
+
+
+def test_write_bytes_atomic_keeps_target_when_write_fails(tmp_path):
+    path = tmp_path / 'report.json'
+    path.write_bytes(b'{"ok": true}')
+
+    with pytest.raises(TypeError):
+        storage.write_bytes_atomic(path, 'not bytes')
+
+    assert path.read_bytes() == b'{"ok": true}'
+    assert os.listdir(tmp_path) == ['report.json']
+
+
+@pytest.mark.skipif(not hasattr(os, 'fchmod'), reason='needs POSIX permissions')
+def test_write_bytes_atomic_uses_umask_default_for_new_files(tmp_path):
+    path = storage.write_bytes_atomic(tmp_path / 'new.json', b'{}')
+
+    assert file_mode(path) == storage.DEFAULT_FILE_MODE
+
+
+@pytest.mark.skipif(not hasattr(os, 'fchmod'), reason='needs POSIX permissions')
+def test_write_bytes_atomic_preserves_existing_mode(tmp_path):
+    path = tmp_path / 'shared.json'
+    path.write_bytes(b'{}')
+    os.chmod(path, 0o640)
+
+    storage.write_bytes_atomic(path, b'{"updated": true}')
+
+    assert file_mode(path) == 0o640
+
+
+@pytest.mark.skipif(not hasattr(os, 'fchmod'), reason='needs POSIX permissions')
+def test_write_bytes_atomic_applies_explicit_mode(tmp_path):
+    path = tmp_path / 'private.json'
+    path.write_bytes(b'{}')
+    os.chmod(path, 0o644)
+
+    storage.write_bytes_atomic(path, b'{}', mode=0o600)
+
+    assert file_mode(path) == 0o600